@@ -11,6 +11,7 @@ import pygame
 
 from settings import SCREEN_W, SCREEN_H, FPS, SCENE_AIRSHIP, SCENE_FREEFALL, SCENE_SURFACE, SCENE_DEATH, PLAYER_MAX_HP
 from scenes import AirshipScene, FreefallScene, SurfaceScene, DeathScene
+from hud import SpriteCache
 
 
 def seed_screen(screen: pygame.Surface, clock: pygame.time.Clock) -> int | None:
@@ -19,6 +20,28 @@ def seed_screen(screen: pygame.Surface, clock: pygame.time.Clock) -> int | None:
     font = pygame.font.SysFont(None, 36)
     font_small = pygame.font.SysFont(None, 24)
 
+    # Static text is rendered once; only the seed input changes per frame
+    title = font_title.render("ASH DIVER", True, (200, 200, 210))
+    subtitle = font_small.render("Roguelike Exploration Platformer", True, (120, 120, 140))
+    prompt = font.render("Enter seed (or press Enter for random):", True, (180, 180, 190))
+    hint1 = font_small.render("ENTER = start    ESC = quit    F11 = fullscreen", True, (90, 90, 110))
+    controls = [
+        "WASD / Arrows - Move + Jump",
+        "Space - Jump (also jump off ladders)",
+        "Left Click - Attack (melee or ranged)",
+        "Q - Swap weapon",
+        "H - Use medkit",
+        "E - Interact (open crates, activate extraction)",
+        "Tab - Inventory",
+    ]
+    header = font_small.render("Controls:", True, (140, 140, 160))
+    control_lines = [font_small.render(line, True, (100, 100, 120)) for line in controls]
+
+    box_w = 320
+    box_h = 44
+    box_x = SCREEN_W // 2 - box_w // 2
+    box_y = 350
+
     seed_text = ""
     cursor_blink = 0.0
 
@@ -53,20 +76,11 @@ def seed_screen(screen: pygame.Surface, clock: pygame.time.Clock) -> int | None:
         # Render
         screen.fill((15, 15, 25))
 
-        title = font_title.render("ASH DIVER", True, (200, 200, 210))
         screen.blit(title, (SCREEN_W // 2 - title.get_width() // 2, 120))
-
-        subtitle = font_small.render("Roguelike Exploration Platformer", True, (120, 120, 140))
         screen.blit(subtitle, (SCREEN_W // 2 - subtitle.get_width() // 2, 185))
-
-        prompt = font.render("Enter seed (or press Enter for random):", True, (180, 180, 190))
         screen.blit(prompt, (SCREEN_W // 2 - prompt.get_width() // 2, 300))
 
         # Input box
-        box_w = 320
-        box_h = 44
-        box_x = SCREEN_W // 2 - box_w // 2
-        box_y = 350
         pygame.draw.rect(screen, (40, 40, 55), (box_x, box_y, box_w, box_h))
         pygame.draw.rect(screen, (100, 100, 120), (box_x, box_y, box_w, box_h), 2)
 
@@ -75,25 +89,13 @@ def seed_screen(screen: pygame.Surface, clock: pygame.time.Clock) -> int | None:
         input_surf = font.render(display_text, True, (220, 220, 230))
         screen.blit(input_surf, (box_x + 10, box_y + 8))
 
-        hint1 = font_small.render("ENTER = start    ESC = quit    F11 = fullscreen", True, (90, 90, 110))
         screen.blit(hint1, (SCREEN_W // 2 - hint1.get_width() // 2, 420))
 
         # Controls reference
-        controls = [
-            "WASD / Arrows - Move + Jump",
-            "Space - Jump (also jump off ladders)",
-            "Left Click - Attack (melee or ranged)",
-            "Q - Swap weapon",
-            "H - Use medkit",
-            "E - Interact (open crates, activate extraction)",
-            "Tab - Inventory",
-        ]
         cy = 490
-        header = font_small.render("Controls:", True, (140, 140, 160))
         screen.blit(header, (SCREEN_W // 2 - 120, cy))
         cy += 24
-        for line in controls:
-            t = font_small.render(line, True, (100, 100, 120))
+        for t in control_lines:
             screen.blit(t, (SCREEN_W // 2 - 120, cy))
             cy += 20
 
@@ -106,6 +108,13 @@ def main():
     pygame.display.set_caption("Ash Diver")
     clock = pygame.time.Clock()
 
+    # Nothing consumes these; keep them out of the queue so high-rate mice
+    # don't bloat every event.get() (aiming reads pygame.mouse.get_pos())
+    pygame.event.set_blocked([pygame.MOUSEMOTION, pygame.TEXTINPUT, pygame.TEXTEDITING])
+
+    # convert_alpha() needs the display, so preload right after set_mode
+    SpriteCache.preload_all()
+
     # Seed selection screen
     seed = seed_screen(screen, clock)
     if seed is None:
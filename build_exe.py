@@ -2,15 +2,19 @@
 """Build Ash Diver into a standalone executable.
 
 Usage:
-    python build_exe.py
+    python build_exe.py [--console] [--upx-dir DIR]
+
+    --console   Keep the console window (stderr visible) for profiling builds
+    --upx-dir   Compress the bundled binaries with UPX from DIR
 
 Produces dist/AshDiver/ with the executable and all assets.
 PyInstaller builds for the current OS — run this on Windows to get a .exe.
 
 Requirements:
-    pip install pyinstaller pygame-ce pillow numpy
+    pip install "pyinstaller>=6.9" pygame-ce pillow numpy
 """
 
+import argparse
 import subprocess
 import sys
 from pathlib import Path
@@ -18,6 +22,11 @@ from pathlib import Path
 ROOT = Path(__file__).parent
 
 def main():
+    p = argparse.ArgumentParser(description="Build Ash Diver with PyInstaller")
+    p.add_argument("--console", action="store_true", help="Keep the console window (profiling builds)")
+    p.add_argument("--upx-dir", default=None, help="Directory containing the UPX binary")
+    opts = p.parse_args()
+
     # Ensure sprites are generated
     print("Generating sprites...")
     subprocess.run([sys.executable, str(ROOT / "generate_sprites.py")], check=True)
@@ -26,13 +35,23 @@ def main():
         sys.executable, "-m", "PyInstaller",
         "--name", "AshDiver",
         "--onedir",
-        "--windowed",
         "--add-data", f"{ROOT / 'assets'}{':' if sys.platform != 'win32' else ';'}assets",
         "--icon", "NONE",
+        # Byte-compile bundled modules with -O (the game uses no asserts)
+        "--optimize", "1",
+        # Stdlib GUI/test packages the game never imports
+        "--exclude-module", "tkinter",
+        "--exclude-module", "test",
         "--clean",
         "--noconfirm",
-        str(ROOT / "ash_diver.py"),
     ]
+    if not opts.console:
+        args.append("--windowed")
+    if sys.platform != "win32":
+        args.append("--strip")  # Drop debug symbols from bundled shared libs
+    if opts.upx_dir:
+        args += ["--upx-dir", opts.upx_dir]
+    args.append(str(ROOT / "ash_diver.py"))
     print("Running PyInstaller...")
     subprocess.run(args, check=True)
     print("\nBuild complete! Output in dist/AshDiver/")
@@ -27,17 +27,15 @@ class Camera:
         self.y = max(0.0, min(self.y, self.map_h - SCREEN_H))
 
     def visible_tile_range(self) -> tuple[int, int, int, int]:
-        col_start = max(0, int(self.x) // TILE_SIZE)
-        row_start = max(0, int(self.y) // TILE_SIZE)
-        col_end = min(
-            (int(self.x) + SCREEN_W) // TILE_SIZE + 1,
-            self.map_w // TILE_SIZE,
-        )
-        row_end = min(
-            (int(self.y) + SCREEN_H) // TILE_SIZE + 1,
-            self.map_h // TILE_SIZE,
-        )
+        # Locals instead of repeated global/attribute loads; called every frame
+        ts = TILE_SIZE
+        ix, iy = int(self.x), int(self.y)
+        col_start = max(0, ix // ts)
+        row_start = max(0, iy // ts)
+        col_end = min((ix + SCREEN_W) // ts + 1, self.map_w // ts)
+        row_end = min((iy + SCREEN_H) // ts + 1, self.map_h // ts)
         return col_start, col_end, row_start, row_end
 
     def apply(self, x: float, y: float) -> tuple[int, int]:
+        # Per-entity render loops inline this as int(x - cam_x) with a hoisted cam_x
         return int(x - self.x), int(y - self.y)
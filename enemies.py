@@ -2,15 +2,24 @@
 
 import random
 
+import numpy as np
 import pygame
 
 from settings import (
-    TILE_SIZE, SOLID_TILES, GRAVITY, MAX_FALL,
+    TILE_SIZE, GRAVITY, MAX_FALL,
     SIREN_HP, SIREN_SPEED, SIREN_DETECT_RANGE,
     SIREN_ATTACK_RANGE, SIREN_ATTACK_DAMAGE, SIREN_ATTACK_COOLDOWN,
-    SIREN_JUMP_VEL, SIREN_W, SIREN_H,
+    SIREN_JUMP_VEL, SIREN_W, SIREN_H, SIREN_SLEEP_DISTANCE,
     SCRAP_WOOD, SCRAP_METAL,
 )
+from physics import resolve_x, resolve_y
+
+# Squared ranges so update() compares dx*dx + dy*dy without a sqrt
+_DETECT_RANGE_SQ = SIREN_DETECT_RANGE ** 2
+_LOSE_RANGE_SQ = (SIREN_DETECT_RANGE * 1.5) ** 2
+_ATTACK_RANGE_SQ = SIREN_ATTACK_RANGE ** 2
+
+_WALK_SPRITES = ("siren_walk1", "siren_walk2")
 
 
 class Siren:
@@ -19,6 +28,13 @@ class Siren:
     STATE_ATTACK = 2
     STATE_DEAD = 3
 
+    __slots__ = (
+        "x", "y", "vx", "vy", "on_ground", "facing", "_rect",
+        "hp", "alive", "state", "asleep",
+        "attack_cooldown", "wander_timer", "wander_dir", "death_timer",
+        "walk_timer",
+    )
+
     def __init__(self, x: float, y: float):
         self.x = x
         self.y = y
@@ -26,21 +42,23 @@ class Siren:
         self.vy = 0.0
         self.on_ground = False
         self.facing = 1
+        self._rect = pygame.Rect(int(x), int(y), SIREN_W, SIREN_H)
 
         self.hp = SIREN_HP
         self.alive = True
         self.state = self.STATE_WANDER
+        self.asleep = False  # far from the player and idle; update() does nothing
 
         self.attack_cooldown = 0.0
         self.wander_timer = 0.0
-        self.wander_dir = random.choice([-1, 1])
+        self.wander_dir = -1 if random.random() < 0.5 else 1
         self.death_timer = 0.0
 
         self.walk_timer = 0.0
 
     @property
     def rect(self) -> pygame.Rect:
-        return pygame.Rect(int(self.x), int(self.y), SIREN_W, SIREN_H)
+        return self._rect
 
     @property
     def center_x(self) -> float:
@@ -60,7 +78,23 @@ class Siren:
             self.state = self.STATE_DEAD
             self.death_timer = 0.6
 
-    def update(self, dt: float, grid: list[list[int]], grid_w: int, grid_h: int,
+    @classmethod
+    def awake_mask(cls, sirens: list["Siren"], player_x: float,
+                   player_y: float) -> np.ndarray:
+        """Vectorized sleep pre-check: True for sirens that need update() this frame.
+
+        Same test as the one at the top of update(), done for every siren in
+        one NumPy pass so sleeping sirens never reach the Python-level update.
+        """
+        n = len(sirens)
+        xs = np.fromiter((s.x for s in sirens), dtype=np.float64, count=n)
+        ys = np.fromiter((s.y for s in sirens), dtype=np.float64, count=n)
+        idle = np.fromiter((s.state == cls.STATE_WANDER and s.on_ground for s in sirens),
+                           dtype=bool, count=n)
+        dist = np.abs(player_x - (xs + SIREN_W / 2)) + np.abs(player_y - (ys + SIREN_H / 2))
+        return ~(idle & (dist > SIREN_SLEEP_DISTANCE))
+
+    def update(self, dt: float, solid: np.ndarray, grid_w: int, grid_h: int,
                player_x: float, player_y: float):
         if self.state == self.STATE_DEAD:
             self.death_timer -= dt
@@ -69,28 +103,36 @@ class Siren:
         # Distance to player
         dx = player_x - self.center_x
         dy = player_y - self.center_y
-        dist = (dx * dx + dy * dy) ** 0.5
+        dist_sq = dx * dx + dy * dy
+
+        # Idle sirens far from the player sleep until it comes near
+        self.asleep = (self.state == self.STATE_WANDER and self.on_ground
+                       and abs(dx) + abs(dy) > SIREN_SLEEP_DISTANCE)
+        if self.asleep:
+            return
 
         if self.attack_cooldown > 0:
             self.attack_cooldown -= dt
 
         # State transitions
-        if self.state == self.STATE_WANDER:
-            if dist < SIREN_DETECT_RANGE:
-                self.state = self.STATE_CHASE
-        elif self.state == self.STATE_CHASE:
-            if dist < SIREN_ATTACK_RANGE and self.attack_cooldown <= 0:
-                self.state = self.STATE_ATTACK
-            elif dist > SIREN_DETECT_RANGE * 1.5:
-                self.state = self.STATE_WANDER
-        elif self.state == self.STATE_ATTACK:
-            self.state = self.STATE_CHASE
+        state = self.state
+        if state == self.STATE_WANDER:
+            if dist_sq < _DETECT_RANGE_SQ:
+                state = self.STATE_CHASE
+        elif state == self.STATE_CHASE:
+            if dist_sq < _ATTACK_RANGE_SQ and self.attack_cooldown <= 0:
+                state = self.STATE_ATTACK
+            elif dist_sq > _LOSE_RANGE_SQ:
+                state = self.STATE_WANDER
+        elif state == self.STATE_ATTACK:
+            state = self.STATE_CHASE
+        self.state = state
 
         # Behavior
-        if self.state == self.STATE_WANDER:
+        if state == self.STATE_WANDER:
             self._do_wander(dt)
-        elif self.state == self.STATE_CHASE:
-            self._do_chase(dt, dx, grid, grid_w, grid_h)
+        elif state == self.STATE_CHASE:
+            self._do_chase(dt, dx, solid, grid_w, grid_h)
 
         # Walk animation
         if abs(self.vx) > 1:
@@ -101,27 +143,30 @@ class Siren:
         # Physics
         self.vy = min(self.vy + GRAVITY * dt, MAX_FALL)
         self.x += self.vx * dt
-        self._resolve_x(grid, grid_w, grid_h)
+        self._resolve_x(solid, grid_w, grid_h)
         self.y += self.vy * dt
-        self._resolve_y(grid, grid_w, grid_h)
+        self._resolve_y(solid, grid_w, grid_h)
 
         # Map boundary clamping
         map_w_px = grid_w * TILE_SIZE
         map_h_px = grid_h * TILE_SIZE
         self.x = max(0, min(self.x, map_w_px - SIREN_W))
         self.y = max(0, min(self.y, map_h_px - SIREN_H))
+        self._rect.x = int(self.x)
+        self._rect.y = int(self.y)
 
     def _do_wander(self, dt: float):
         self.wander_timer -= dt
         if self.wander_timer <= 0:
-            self.wander_dir = random.choice([-1, 0, 0, 1])  # often stop
-            self.wander_timer = random.uniform(1.0, 3.0)
+            r = random.random()
+            self.wander_dir = -1 if r < 0.25 else (1 if r < 0.5 else 0)  # often stop
+            self.wander_timer = 1.0 + random.random() * 2.0
         self.vx = self.wander_dir * SIREN_SPEED * 0.4
         if self.wander_dir != 0:
             self.facing = self.wander_dir
 
     def _do_chase(self, dt: float, dx: float,
-                  grid: list[list[int]], grid_w: int, grid_h: int):
+                  solid: np.ndarray, grid_w: int, grid_h: int):
         if dx > 5:
             self.vx = SIREN_SPEED
             self.facing = 1
@@ -132,14 +177,14 @@ class Siren:
             self.vx = 0
 
         # Jump if blocked
-        if self.on_ground and self._is_blocked_ahead(grid, grid_w, grid_h):
+        if self.on_ground and self._is_blocked_ahead(solid, grid_w, grid_h):
             self.vy = SIREN_JUMP_VEL
 
-    def _is_blocked_ahead(self, grid: list[list[int]], grid_w: int, grid_h: int) -> bool:
+    def _is_blocked_ahead(self, solid: np.ndarray, grid_w: int, grid_h: int) -> bool:
         check_x = int(self.center_x + self.facing * (SIREN_W / 2 + 2)) // TILE_SIZE
         check_y = int(self.center_y) // TILE_SIZE
         if 0 <= check_x < grid_w and 0 <= check_y < grid_h:
-            return grid[check_y][check_x] in SOLID_TILES
+            return bool(solid[check_y, check_x])
         return False
 
     def try_attack(self, player_rect: pygame.Rect) -> int:
@@ -163,59 +208,19 @@ class Siren:
     def drop_loot(self) -> list[tuple[str, int]]:
         """Roll loot on death. Returns [(item_id, count), ...]."""
         if random.random() < 0.4:
-            item = random.choice([SCRAP_WOOD, SCRAP_METAL])
+            item = SCRAP_WOOD if random.random() < 0.5 else SCRAP_METAL
             return [(item, 1)]
         return []
 
-    # ── Collision (same as player) ───────────────────────────────────────────
-
-    def _get_overlapping_tiles(self, grid, grid_w, grid_h):
-        r = self.rect
-        col_start = max(0, r.left // TILE_SIZE)
-        col_end = min(grid_w, (r.right - 1) // TILE_SIZE + 1)
-        row_start = max(0, r.top // TILE_SIZE)
-        row_end = min(grid_h, (r.bottom - 1) // TILE_SIZE + 1)
-        for row in range(row_start, row_end):
-            for col in range(col_start, col_end):
-                if grid[row][col] in SOLID_TILES:
-                    tile_rect = pygame.Rect(
-                        col * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE
-                    )
-                    if r.colliderect(tile_rect):
-                        yield col, row, tile_rect
-
-    def _resolve_x(self, grid, grid_w, grid_h):
-        for _col, _row, tile_rect in self._get_overlapping_tiles(grid, grid_w, grid_h):
-            if self.vx > 0:
-                self.x = tile_rect.left - SIREN_W
-            elif self.vx < 0:
-                self.x = tile_rect.right
-            else:
-                r = self.rect
-                overlap_left = r.right - tile_rect.left
-                overlap_right = tile_rect.right - r.left
-                if overlap_left < overlap_right:
-                    self.x = tile_rect.left - SIREN_W
-                else:
-                    self.x = tile_rect.right
-
-    def _resolve_y(self, grid, grid_w, grid_h):
-        self.on_ground = False
-        for _col, _row, tile_rect in self._get_overlapping_tiles(grid, grid_w, grid_h):
-            if self.vy > 0:
-                self.y = tile_rect.top - SIREN_H
-                self.vy = 0.0
-                self.on_ground = True
-            elif self.vy < 0:
-                self.y = tile_rect.bottom
-                self.vy = 0.0
-            else:
-                r = self.rect
-                if (r.bottom - tile_rect.top) < (tile_rect.bottom - r.top):
-                    self.y = tile_rect.top - SIREN_H
-                    self.on_ground = True
-                else:
-                    self.y = tile_rect.bottom
+    # ── Collision (shared with player) ───────────────────────────────────────
+
+    def _resolve_x(self, solid, grid_w, grid_h):
+        self.x = resolve_x(solid, grid_w, grid_h, self.x, self.y, SIREN_W, SIREN_H, self.vx)
+
+    def _resolve_y(self, solid, grid_w, grid_h):
+        self.y, self.vy, self.on_ground = resolve_y(
+            solid, grid_w, grid_h, self.x, self.y, SIREN_W, SIREN_H, self.vy
+        )
 
     # ── Sprite state ─────────────────────────────────────────────────────────
 
@@ -225,6 +230,5 @@ class Siren:
         if self.state == self.STATE_ATTACK:
             return "siren_attack"
         if abs(self.vx) > 1:
-            frame = int(self.walk_timer) % 2
-            return f"siren_walk{frame + 1}"
+            return _WALK_SPRITES[int(self.walk_timer) % 2]
         return "siren_idle"
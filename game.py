@@ -14,6 +14,7 @@ Controls:
 import sys
 from pathlib import Path
 
+import numpy as np
 import pygame
 
 from generate_blueprint import (
@@ -29,6 +30,9 @@ from generate_blueprint import (
 
 SCREEN_W, SCREEN_H = 1280, 720
 TILE_SIZE = 16
+TILE_SHIFT = 4  # log2(TILE_SIZE): px >> TILE_SHIFT == px // TILE_SIZE
+SUBPIXEL_SHIFT = 8  # player position is stored in 1/256 px
+SUBPIXEL_ONE = 1 << SUBPIXEL_SHIFT
 PLAYER_W, PLAYER_H = 12, 28
 GRAVITY = 980.0
 JUMP_VEL = -330.0
@@ -38,27 +42,30 @@ CAMERA_LERP = 0.1
 
 SOLID_TILES = {T_TOP, T_FILL}
 
+# Reused by Player._get_overlapping_tiles; consumers must not keep a reference
+_SCRATCH_TILE = pygame.Rect(0, 0, TILE_SIZE, TILE_SIZE)
+
+# Maps up to this many pixels are pre-rendered into a single background surface
+MAX_PRERENDER_PIXELS = 4096 * 4096
+
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
 
-def load_grid(path: str) -> list[list[int]]:
-    """Read a CSV tile grid into a 2D list of ints."""
-    grid: list[list[int]] = []
-    with open(path) as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                grid.append([int(v) for v in line.split(",")])
-    return grid
+def load_grid(path: str) -> np.ndarray:
+    """Read a CSV tile grid into a 2D uint8 array (rows x cols)."""
+    return np.loadtxt(path, delimiter=",", dtype=np.uint8, ndmin=2)
 
 
-def find_tile(grid: list[list[int]], tile_id: int) -> tuple[int, int] | None:
+def find_tile(grid: np.ndarray, tile_id: int) -> tuple[int, int] | None:
     """Return the first (col, row) where *tile_id* appears, or None."""
-    for row_idx, row in enumerate(grid):
-        for col_idx, val in enumerate(row):
-            if val == tile_id:
-                return col_idx, row_idx
-    return None
+    hits = grid.ravel() == tile_id
+    if hits.size == 0:
+        return None
+    idx = int(np.argmax(hits))  # first True in row-major order
+    if not hits[idx]:
+        return None
+    row, col = divmod(idx, grid.shape[1])
+    return col, row
 
 
 # ── Camera ───────────────────────────────────────────────────────────────────
@@ -107,93 +114,108 @@ class Camera:
 
 
 class Player:
+    """Prototype player. Position is fixed-point (1/256 px) so collision works
+    on plain ints: ``x_fx >> SUBPIXEL_SHIFT`` is the pixel, ``>> TILE_SHIFT``
+    on top of that is the tile."""
+
     def __init__(self, x: float, y: float):
-        self.x = x
-        self.y = y
+        self.x_fx = int(x * SUBPIXEL_ONE)
+        self.y_fx = int(y * SUBPIXEL_ONE)
         self.vx = 0.0
         self.vy = 0.0
         self.on_ground = False
+        self._rect = pygame.Rect(self.x_fx >> SUBPIXEL_SHIFT, self.y_fx >> SUBPIXEL_SHIFT,
+                                 PLAYER_W, PLAYER_H)
+
+    @property
+    def x(self) -> float:
+        return self.x_fx / SUBPIXEL_ONE
+
+    @property
+    def y(self) -> float:
+        return self.y_fx / SUBPIXEL_ONE
 
     @property
     def rect(self) -> pygame.Rect:
-        return pygame.Rect(int(self.x), int(self.y), PLAYER_W, PLAYER_H)
+        return self._rect
 
-    def update(self, dt: float, grid: list[list[int]], grid_w: int, grid_h: int):
+    def update(self, dt: float, solid: np.ndarray, grid_w: int, grid_h: int):
         # Gravity
         self.vy = min(self.vy + GRAVITY * dt, MAX_FALL)
 
         # Move X
-        self.x += self.vx * dt
-        self._resolve_x(grid, grid_w, grid_h)
+        self.x_fx += int(self.vx * dt * SUBPIXEL_ONE)
+        self._rect.x = self.x_fx >> SUBPIXEL_SHIFT
+        self._resolve_x(solid, grid_w, grid_h)
 
         # Move Y
-        self.y += self.vy * dt
-        self._resolve_y(grid, grid_w, grid_h)
+        self.y_fx += int(self.vy * dt * SUBPIXEL_ONE)
+        self._rect.y = self.y_fx >> SUBPIXEL_SHIFT
+        self._resolve_y(solid, grid_w, grid_h)
+
+    def _tile_span(self, grid_w: int, grid_h: int) -> tuple[int, int, int, int]:
+        """Return (col_start, col_end, row_start, row_end) of tiles under the player."""
+        r = self._rect
+        col_start = max(0, r.left >> TILE_SHIFT)
+        col_end = min(grid_w, ((r.right - 1) >> TILE_SHIFT) + 1)
+        row_start = max(0, r.top >> TILE_SHIFT)
+        row_end = min(grid_h, ((r.bottom - 1) >> TILE_SHIFT) + 1)
+        return col_start, col_end, row_start, row_end
 
-    def _get_overlapping_tiles(self, grid: list[list[int]], grid_w: int, grid_h: int):
+    def _get_overlapping_tiles(self, solid: np.ndarray, grid_w: int, grid_h: int):
         """Yield (col, row, tile_rect) for every solid tile overlapping the player."""
-        r = self.rect
-        col_start = max(0, r.left // TILE_SIZE)
-        col_end = min(grid_w, (r.right - 1) // TILE_SIZE + 1)
-        row_start = max(0, r.top // TILE_SIZE)
-        row_end = min(grid_h, (r.bottom - 1) // TILE_SIZE + 1)
-        for row in range(row_start, row_end):
-            for col in range(col_start, col_end):
-                if grid[row][col] in SOLID_TILES:
-                    tile_rect = pygame.Rect(
-                        col * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE
-                    )
-                    if r.colliderect(tile_rect):
-                        yield col, row, tile_rect
-
-    def _resolve_x(self, grid: list[list[int]], grid_w: int, grid_h: int):
-        for _col, _row, tile_rect in self._get_overlapping_tiles(grid, grid_w, grid_h):
-            r = self.rect
+        col_start, col_end, row_start, row_end = self._tile_span(grid_w, grid_h)
+        if col_end <= col_start or row_end <= row_start:
+            return
+        rows, cols = np.nonzero(solid[row_start:row_end, col_start:col_end])
+        for row, col in zip((rows + row_start).tolist(), (cols + col_start).tolist()):
+            # Tiles in the [start, end) range always intersect r, no rect test needed
+            tile_rect = _SCRATCH_TILE
+            tile_rect.x = col << TILE_SHIFT
+            tile_rect.y = row << TILE_SHIFT
+            yield col, row, tile_rect
+
+    def _resolve_x(self, solid: np.ndarray, grid_w: int, grid_h: int):
+        for _col, _row, tile_rect in self._get_overlapping_tiles(solid, grid_w, grid_h):
+            r = self._rect
             if self.vx > 0:
-                self.x = tile_rect.left - PLAYER_W
+                r.x = tile_rect.left - PLAYER_W
             elif self.vx < 0:
-                self.x = tile_rect.right
+                r.x = tile_rect.right
             else:
                 # Pushed into a tile without horizontal velocity — nudge out
                 overlap_left = r.right - tile_rect.left
                 overlap_right = tile_rect.right - r.left
                 if overlap_left < overlap_right:
-                    self.x = tile_rect.left - PLAYER_W
+                    r.x = tile_rect.left - PLAYER_W
                 else:
-                    self.x = tile_rect.right
+                    r.x = tile_rect.right
+            self.x_fx = r.x << SUBPIXEL_SHIFT
 
-    def _resolve_y(self, grid: list[list[int]], grid_w: int, grid_h: int):
+    def _resolve_y(self, solid: np.ndarray, grid_w: int, grid_h: int):
         self.on_ground = False
-        for _col, _row, tile_rect in self._get_overlapping_tiles(grid, grid_w, grid_h):
-            r = self.rect
+        for _col, _row, tile_rect in self._get_overlapping_tiles(solid, grid_w, grid_h):
+            r = self._rect
             if self.vy > 0:
-                self.y = tile_rect.top - PLAYER_H
+                r.y = tile_rect.top - PLAYER_H
                 self.vy = 0.0
                 self.on_ground = True
             elif self.vy < 0:
-                self.y = tile_rect.bottom
+                r.y = tile_rect.bottom
                 self.vy = 0.0
             else:
                 overlap_top = r.bottom - tile_rect.top
                 overlap_bottom = tile_rect.bottom - r.top
                 if overlap_top < overlap_bottom:
-                    self.y = tile_rect.top - PLAYER_H
+                    r.y = tile_rect.top - PLAYER_H
                     self.on_ground = True
                 else:
-                    self.y = tile_rect.bottom
-
-    def check_win(self, grid: list[list[int]], grid_w: int, grid_h: int) -> bool:
-        """Return True if the player overlaps any T_GOAL tile."""
-        r = self.rect
-        col_start = max(0, r.left // TILE_SIZE)
-        col_end = min(grid_w, (r.right - 1) // TILE_SIZE + 1)
-        row_start = max(0, r.top // TILE_SIZE)
-        row_end = min(grid_h, (r.bottom - 1) // TILE_SIZE + 1)
-        for row in range(row_start, row_end):
-            for col in range(col_start, col_end):
-                if grid[row][col] == T_GOAL:
-                    return True
-        return False
+                    r.y = tile_rect.bottom
+            self.y_fx = r.y << SUBPIXEL_SHIFT
+
+    def check_win(self, goal_rects: list[pygame.Rect]) -> bool:
+        """Return True if the player overlaps any goal tile rect."""
+        return self._rect.collidelist(goal_rects) >= 0
 
 
 # ── Game ─────────────────────────────────────────────────────────────────────
@@ -205,32 +227,64 @@ class Game:
         self.screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
         pygame.display.set_caption("Ash Diver")
         self.clock = pygame.time.Clock()
+        # Only QUIT/KEYDOWN are handled; don't queue mouse motion or text events
+        pygame.event.set_blocked([pygame.MOUSEMOTION, pygame.TEXTINPUT, pygame.TEXTEDITING])
 
         self.csv_path = csv_path
-        self.grid: list[list[int]] = []
+        self.grid: np.ndarray = np.zeros((0, 0), dtype=np.uint8)
+        self.solid_mask: np.ndarray = np.zeros((0, 0), dtype=bool)
         self.grid_w = 0
         self.grid_h = 0
-        self.tile_surfaces: dict[int, pygame.Surface] = {}
+        # Indexed by tile id; sized for the whole uint8 range so any grid value is safe
+        self.tile_surfaces: list[pygame.Surface | None] = [None] * 256
+        self.goal_rects: list[pygame.Rect] = []
+        self.background: pygame.Surface | None = None
+        self._last_cam: tuple[int, int] | None = None
+        self._cached_blits: list[tuple[pygame.Surface, tuple[int, int]]] = []
         self.player: Player | None = None
         self.camera: Camera | None = None
         self.won = False
         self.font: pygame.font.Font | None = None
+        self._win_overlay: pygame.Surface | None = None
+        self._win_lines: list[tuple[pygame.Surface, tuple[int, int]]] = []
 
         self._load()
 
     def _load(self):
         self.grid = load_grid(self.csv_path)
-        self.grid_h = len(self.grid)
-        self.grid_w = len(self.grid[0]) if self.grid_h > 0 else 0
+        self.grid_h, self.grid_w = self.grid.shape
+        self.solid_mask = np.isin(self.grid, np.fromiter(SOLID_TILES, np.uint8))
 
-        # Pre-render a small colored surface for each tile type
-        self.tile_surfaces.clear()
+        # Goal tiles are static — collect their rects once for check_win
+        self.goal_rects = [
+            pygame.Rect(col * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+            for row, col in np.argwhere(self.grid == T_GOAL).tolist()
+        ]
+
+        # Pre-render a small display-format surface for each tile type
+        self.tile_surfaces = [None] * 256
         for tile_id, rgba in TILE_COLORS.items():
             if tile_id == T_AIR:
                 continue  # Air is the background fill
             surf = pygame.Surface((TILE_SIZE, TILE_SIZE))
             surf.fill(rgba[:3])
-            self.tile_surfaces[tile_id] = surf
+            self.tile_surfaces[tile_id] = surf.convert()
+
+        # Pre-render the static map once; _render then blits one camera sub-rect
+        map_pw = self.grid_w * TILE_SIZE
+        map_ph = self.grid_h * TILE_SIZE
+        self.background = None
+        self._last_cam = None
+        if 0 < map_pw * map_ph <= MAX_PRERENDER_PIXELS:
+            self.background = pygame.Surface((map_pw, map_ph)).convert()
+            self.background.fill(TILE_COLORS[T_AIR][:3])
+            tiles = []
+            for row, grid_row in enumerate(self.grid.tolist()):
+                for col, tile_id in enumerate(grid_row):
+                    surf = self.tile_surfaces[tile_id]
+                    if surf is not None:
+                        tiles.append((surf, (col * TILE_SIZE, row * TILE_SIZE)))
+            self.background.blits(tiles, doreturn=False)
 
         # Find spawn position
         spawn = find_tile(self.grid, T_SPAWN)
@@ -250,6 +304,16 @@ class Game:
         self.won = False
         self.font = pygame.font.SysFont(None, 48)
 
+        # Win screen content is constant — build it once, blit it per frame
+        self._win_overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
+        self._win_overlay.fill((0, 0, 0, 140))
+        line1 = self.font.render("YOU WIN!", True, (255, 255, 100))
+        line2 = self.font.render("Press R to restart", True, (220, 220, 220))
+        self._win_lines = [
+            (line1, (SCREEN_W // 2 - line1.get_width() // 2, SCREEN_H // 2 - 40)),
+            (line2, (SCREEN_W // 2 - line2.get_width() // 2, SCREEN_H // 2 + 10)),
+        ]
+
     def run(self):
         running = True
         while running:
@@ -267,8 +331,8 @@ class Game:
 
             if not self.won:
                 self._handle_input(dt)
-                self.player.update(dt, self.grid, self.grid_w, self.grid_h)
-                if self.player.check_win(self.grid, self.grid_w, self.grid_h):
+                self.player.update(dt, self.solid_mask, self.grid_w, self.grid_h)
+                if self.player.check_win(self.goal_rects):
                     self.won = True
 
             self.camera.update(
@@ -301,16 +365,24 @@ class Game:
         cam_x = int(self.camera.x)
         cam_y = int(self.camera.y)
 
-        # Draw visible tiles
-        c0, c1, r0, r1 = self.camera.visible_tile_range()
-        for row in range(r0, r1):
-            grid_row = self.grid[row]
-            y = row * TILE_SIZE - cam_y
-            for col in range(c0, c1):
-                tile_id = grid_row[col]
-                surf = self.tile_surfaces.get(tile_id)
-                if surf is not None:
-                    self.screen.blit(surf, (col * TILE_SIZE - cam_x, y))
+        if self.background is not None:
+            self.screen.blit(self.background, (0, 0), pygame.Rect(cam_x, cam_y, SCREEN_W, SCREEN_H))
+        else:
+            # Map too large to pre-render — draw visible tiles, re-culling
+            # only when the camera has moved by at least a pixel
+            if (cam_x, cam_y) != self._last_cam:
+                blits = []
+                c0, c1, r0, r1 = self.camera.visible_tile_range()
+                for row, grid_row in enumerate(self.grid[r0:r1].tolist(), r0):
+                    y = row * TILE_SIZE - cam_y
+                    for col in range(c0, c1):
+                        tile_id = grid_row[col]
+                        surf = self.tile_surfaces[tile_id]
+                        if surf is not None:
+                            blits.append((surf, (col * TILE_SIZE - cam_x, y)))
+                self._cached_blits = blits
+                self._last_cam = (cam_x, cam_y)
+            self.screen.blits(self._cached_blits, doreturn=False)
 
         # Draw player
         pr = self.player.rect.move(-cam_x, -cam_y)
@@ -319,14 +391,8 @@ class Game:
 
         # Win overlay
         if self.won:
-            overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 140))
-            self.screen.blit(overlay, (0, 0))
-
-            line1 = self.font.render("YOU WIN!", True, (255, 255, 100))
-            line2 = self.font.render("Press R to restart", True, (220, 220, 220))
-            self.screen.blit(line1, (SCREEN_W // 2 - line1.get_width() // 2, SCREEN_H // 2 - 40))
-            self.screen.blit(line2, (SCREEN_W // 2 - line2.get_width() // 2, SCREEN_H // 2 + 10))
+            self.screen.blit(self._win_overlay, (0, 0))
+            self.screen.blits(self._win_lines, doreturn=False)
 
         pygame.display.flip()
 
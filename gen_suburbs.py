@@ -9,6 +9,7 @@ import random
 from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
 from PIL import Image
 
 from settings import (
@@ -17,6 +18,14 @@ from settings import (
     T_LADDER, TILE_COLORS,
 )
 
+# Tile-id lookup tables (index with a tile or a whole grid)
+# Anything except these can have a container or loot placed on top of it
+_IS_FLOOR = np.ones(256, dtype=bool)
+_IS_FLOOR[[T_AIR, T_SPAWN, T_CONTAINER, T_BALLOON_CRATE]] = False
+# Solid ground for the spawn point and balloon crates
+_IS_GROUND = np.zeros(256, dtype=bool)
+_IS_GROUND[[T_FILL, T_ROAD, T_FLOOR]] = True
+
 
 @dataclass
 class SuburbsConfig:
@@ -35,17 +44,43 @@ class SuburbsGenerator:
     def __init__(self, config: SuburbsConfig | None = None):
         self.cfg = config or SuburbsConfig()
         self.rng = random.Random(self.cfg.seed)
-        self.grid: list[list[int]] = []
+        self.nprng = np.random.default_rng(self.cfg.seed)  # batched per-tile draws
+        self.grid: np.ndarray = np.zeros((0, 0), dtype=np.uint8)  # (height, width)
         self.spawn_pos: tuple[int, int] = (0, 0)
-        self.container_positions: list[tuple[int, int, str]] = []  # (x, y, type)
-        self.balloon_positions: list[tuple[int, int]] = []
-        self.siren_spawn_zones: list[tuple[int, int]] = []  # (x, y) center of each zone
-        self.ground_items: list[tuple[int, int, str]] = []  # (x, y, item_id)
-
-    def generate(self) -> list[list[int]]:
-        self._init_grid()
-        self._make_ground()
-        self._place_roads()
+        # Placements are stored as parallel arrays (tile coords) + label lists;
+        # the tuple-list properties below are kept for callers
+        self.container_x = np.empty(0, dtype=np.int16)
+        self.container_y = np.empty(0, dtype=np.int16)
+        self.container_type: list[str] = []
+        self.balloon_x = np.empty(0, dtype=np.int16)
+        self.balloon_y = np.empty(0, dtype=np.int16)
+        self.siren_zone_x = np.empty(0, dtype=np.int16)  # center of each zone
+        self.siren_zone_y = np.empty(0, dtype=np.int16)
+        self.loot_x = np.empty(0, dtype=np.int16)
+        self.loot_y = np.empty(0, dtype=np.int16)
+        self.loot_item: list[str] = []
+
+    @property
+    def container_positions(self) -> list[tuple[int, int, str]]:
+        """(x, y, type) per container."""
+        return list(zip(self.container_x.tolist(), self.container_y.tolist(), self.container_type))
+
+    @property
+    def balloon_positions(self) -> list[tuple[int, int]]:
+        return list(zip(self.balloon_x.tolist(), self.balloon_y.tolist()))
+
+    @property
+    def siren_spawn_zones(self) -> list[tuple[int, int]]:
+        """(x, y) center of each zone."""
+        return list(zip(self.siren_zone_x.tolist(), self.siren_zone_y.tolist()))
+
+    @property
+    def ground_items(self) -> list[tuple[int, int, str]]:
+        """(x, y, item_id) per loose item."""
+        return list(zip(self.loot_x.tolist(), self.loot_y.tolist(), self.loot_item))
+
+    def generate(self) -> np.ndarray:
+        self._make_terrain()
         self._place_houses()
         self._place_exterior_ladders()
         self._scatter_rubble()
@@ -57,251 +92,215 @@ class SuburbsGenerator:
         self._top_detection()
         return self.grid
 
-    def _init_grid(self):
-        self.grid = [[T_AIR] * self.cfg.width for _ in range(self.cfg.height)]
-
-    def _make_ground(self):
+    def _make_terrain(self):
+        """Build ground and roads in one pass: per-column heights, then one fill."""
         w, h = self.cfg.width, self.cfg.height
-        base_y = self.cfg.ground_y
-        for x in range(w):
-            # Slight elevation variation
-            offset = self.rng.randint(-1, 1)
-            gy = min(h - 1, max(base_y - 2, base_y + offset))
-            for y in range(gy, h):
-                self.grid[y][x] = T_FILL
-
-    def _place_roads(self):
-        w = self.cfg.width
         gy = self.cfg.ground_y
+        # Slight elevation variation: one draw per column, left to right
+        offsets = np.array([self.rng.randint(-1, 1) for _ in range(w)])
+        gy_per_col = np.clip(gy + offsets, gy - 2, h - 1)
+
         # Horizontal roads at ground level
+        road = np.zeros(w, dtype=bool)
         road_xs = sorted(self.rng.sample(range(5, w - 5), min(self.cfg.num_roads * 2, w - 10)))
         for i in range(0, len(road_xs) - 1, 2):
             x_start = road_xs[i]
             x_end = min(road_xs[i] + self.rng.randint(20, 50), road_xs[i + 1] if i + 1 < len(road_xs) else w - 1)
-            for x in range(x_start, min(x_end, w)):
-                # Road replaces top ground tiles
-                if gy - 1 >= 0:
-                    self.grid[gy - 1][x] = T_AIR
-                self.grid[gy][x] = T_ROAD
-                # Clear 3 tiles above road for walkability
-                for dy in range(1, 4):
-                    if gy - dy >= 0:
-                        self.grid[gy - dy][x] = T_AIR
+            road[x_start:x_end] = True
+        # Roads flatten the ground to gy (anything above is clear for walkability)
+        gy_per_col[road] = gy
+
+        rows = np.arange(h)[:, None]
+        self.grid = np.where(rows >= gy_per_col, T_FILL, T_AIR).astype(np.uint8)
+        # Road replaces the top ground tile
+        self.grid[gy, road] = T_ROAD
 
     def _place_houses(self):
         w, h = self.cfg.width, self.cfg.height
         gy = self.cfg.ground_y
-        placed = []
-
-        for _ in range(self.cfg.num_houses * 3):  # more attempts than houses needed
-            if len(placed) >= self.cfg.num_houses:
+        placed = 0
+        # Footprints of placed houses inflated by the required gap
+        # (3 tiles horizontally, 2 vertically); a candidate may not touch it
+        occupied = np.zeros((h, w), dtype=bool)
+        num_houses = self.cfg.num_houses
+        randint = self.rng.randint
+
+        for _ in range(num_houses * 3):  # more attempts than houses needed
+            if placed >= num_houses:
                 break
-            hw = self.rng.randint(8, 15)
-            hh = self.rng.randint(5, 8)
-            hx = self.rng.randint(2, w - hw - 2)
+            hw = randint(8, 15)
+            hh = randint(5, 8)
+            hx = randint(2, w - hw - 2)
             hy = gy - hh  # house sits on ground
 
-            # Check overlap with existing houses
-            overlap = False
-            for px, py, pw, ph in placed:
-                if hx < px + pw + 3 and hx + hw + 3 > px and hy < py + ph + 2 and hy + hh + 2 > py:
-                    overlap = True
-                    break
-            if overlap:
+            if occupied[hy:hy + hh, hx:hx + hw].any():
                 continue
 
             self._build_house(hx, hy, hw, hh)
-            placed.append((hx, hy, hw, hh))
+            occupied[max(0, hy - 2):hy + hh + 2, max(0, hx - 3):hx + hw + 3] = True
+            placed += 1
 
     def _build_house(self, hx: int, hy: int, hw: int, hh: int):
-        w, h = self.cfg.width, self.cfg.height
+        # _place_houses keeps the footprint inside the grid, so plain slices are safe
+        grid = self.grid
         is_ruined = self.rng.random() < 0.35
-
-        for y in range(hy, hy + hh):
-            for x in range(hx, hx + hw):
-                if 0 <= x < w and 0 <= y < h:
-                    # Roof (top row)
-                    if y == hy:
-                        if is_ruined and self.rng.random() < 0.3:
-                            self.grid[y][x] = T_AIR  # collapsed roof section
-                        else:
-                            self.grid[y][x] = T_ROOF
-                    # Walls (left and right edges)
-                    elif x == hx or x == hx + hw - 1:
-                        if is_ruined and self.rng.random() < 0.2:
-                            self.grid[y][x] = T_RUBBLE
-                        else:
-                            self.grid[y][x] = T_WALL
-                    # Floor (bottom row)
-                    elif y == hy + hh - 1:
-                        self.grid[y][x] = T_FLOOR
-                    # Interior
-                    else:
-                        self.grid[y][x] = T_AIR
+        bottom = hy + hh - 1
+        right = hx + hw - 1
+
+        # Shell: roof (top row), walls (side columns, corners included), floor, interior
+        grid[hy + 1:bottom, hx + 1:right] = T_AIR
+        grid[bottom, hx + 1:right] = T_FLOOR
+        grid[hy, hx:hx + hw] = T_ROOF
+        grid[hy + 1:hy + hh, hx] = T_WALL
+        grid[hy + 1:hy + hh, right] = T_WALL
+
+        if is_ruined:
+            collapsed = self.nprng.random(hw) < 0.3
+            rubble = self.nprng.random((hh - 1, 2)) < 0.2  # (left, right) wall per row
+            grid[hy, hx:hx + hw][collapsed] = T_AIR  # collapsed roof sections
+            grid[hy + 1:hy + hh, [hx, right]] = np.where(rubble, T_RUBBLE, T_WALL)
 
         # Doorways — punch holes in both side walls near the bottom
         door_y_start = hy + hh - 3  # 3 tiles of clearance for the player
-        for y in range(door_y_start, hy + hh - 1):
-            if 0 <= y < h:
-                if 0 <= hx < w:
-                    self.grid[y][hx] = T_AIR
-                if 0 <= hx + hw - 1 < w:
-                    self.grid[y][hx + hw - 1] = T_AIR
+        grid[door_y_start:bottom, hx] = T_AIR
+        grid[door_y_start:bottom, right] = T_AIR
 
         # Interior ladder — place near one side wall, from floor to roof
         ladder_x = hx + 2 if self.rng.random() < 0.5 else hx + hw - 3
-        if 0 <= ladder_x < w:
-            for y in range(hy + 1, hy + hh - 1):
-                if 0 <= y < h and self.grid[y][ladder_x] == T_AIR:
-                    self.grid[y][ladder_x] = T_LADDER
-            # Open one roof tile above ladder for roof access
-            if 0 <= hy < h:
-                self.grid[hy][ladder_x] = T_LADDER
-
-        # Internal divider wall for multi-room houses
+        shaft = grid[hy + 1:bottom, ladder_x]
+        shaft[shaft == T_AIR] = T_LADDER
+        # Open one roof tile above ladder for roof access
+        grid[hy, ladder_x] = T_LADDER
+
+        # Internal divider wall for multi-room houses, leaving a doorway
         if hw >= 12:
             div_x = hx + hw // 2
-            for y in range(hy + 1, hy + hh - 1):
-                if 0 <= div_x < w and 0 <= y < h:
-                    # Leave a doorway
-                    if y >= hy + hh - 3:
-                        self.grid[y][div_x] = T_AIR
-                    else:
-                        self.grid[y][div_x] = T_WALL
+            grid[hy + 1:door_y_start, div_x] = T_WALL
+            grid[door_y_start:bottom, div_x] = T_AIR
 
     def _place_exterior_ladders(self):
         """Place freestanding ladders in open areas for general vertical mobility."""
-        w, h = self.cfg.width, self.cfg.height
+        w = self.cfg.width
         gy = self.cfg.ground_y
         spacing = w // 8  # roughly every 20 tiles
-        for x_base in range(10, w - 10, spacing):
-            lx = x_base + self.rng.randint(-3, 3)
-            lx = max(1, min(lx, w - 2))
-            # Place a 4-tile ladder rising from ground level
-            for dy in range(4):
-                ly = gy - 1 - dy
-                if 0 <= ly < h and self.grid[ly][lx] == T_AIR:
-                    self.grid[ly][lx] = T_LADDER
+        xs = np.arange(10, w - 10, spacing)
+        xs = np.clip(xs + self.nprng.integers(-3, 4, size=len(xs)), 1, w - 2)
+        # Place a 4-tile ladder rising from ground level, over air only
+        rows = slice(max(0, gy - 4), gy)
+        cols = self.grid[rows, xs]
+        self.grid[rows, xs] = np.where(cols == T_AIR, T_LADDER, cols)
 
     def _scatter_rubble(self):
-        w = self.cfg.width
-        gy = self.cfg.ground_y
-        for _ in range(self.cfg.num_rubble_piles):
-            rx = self.rng.randint(2, w - 3)
-            ry = gy - 1
-            if 0 <= ry < self.cfg.height and self.grid[ry][rx] == T_AIR:
-                self.grid[ry][rx] = T_RUBBLE
+        w, h = self.cfg.width, self.cfg.height
+        ry = self.cfg.ground_y - 1
+        if not 0 <= ry < h:
+            return
+        # All pile columns in one draw; piles only land on open ground-level air
+        xs = self.nprng.integers(2, w - 2, size=self.cfg.num_rubble_piles)
+        row = self.grid[ry]
+        row[xs[row[xs] == T_AIR]] = T_RUBBLE
+
+    def _open_cells(self, y0: int, y1: int, x0: int, x1: int,
+                    floor: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return (xs, ys) of air tiles in rows [y0, y1) x cols [x0, x1) standing on *floor*.
+
+        *floor* is a boolean mask over the whole grid marking walkable-on tiles.
+        """
+        y1 = min(y1, self.cfg.height - 1)  # every candidate needs a row below it
+        ok = (self.grid[y0:y1, x0:x1] == T_AIR) & floor[y0 + 1:y1 + 1, x0:x1]
+        ys, xs = np.nonzero(ok)
+        return (xs + x0).astype(np.int16), (ys + y0).astype(np.int16)
+
+    def _pick(self, n: int, k: int) -> list[int]:
+        """Draw min(k, n) distinct indices into a candidate set of size n."""
+        return self.rng.sample(range(n), min(k, n))
 
     def _place_containers(self):
-        w, h = self.cfg.width, self.cfg.height
+        w = self.cfg.width
         gy = self.cfg.ground_y
-        placed = 0
 
-        # Also check air tiles inside houses (wider y range)
-        for _ in range(self.cfg.num_containers * 10):
-            if placed >= self.cfg.num_containers:
-                break
-            cx = self.rng.randint(3, w - 4)
-            cy = self.rng.randint(max(0, gy - 12), gy - 1)
-            if 0 <= cy < h and 0 <= cx < w and self.grid[cy][cx] == T_AIR:
-                # Check has floor below (any solid surface)
-                if cy + 1 < h and self.grid[cy + 1][cx] not in (T_AIR, T_SPAWN, T_CONTAINER, T_BALLOON_CRATE):
-                    self.grid[cy][cx] = T_CONTAINER
-                    ctype = self.rng.choice(["crate", "crate", "locker", "rubble_pile"])
-                    self.container_positions.append((cx, cy, ctype))
-                    placed += 1
+        # Any solid surface counts as floor; also covers air tiles inside houses
+        floor = _IS_FLOOR[self.grid]
+        xs, ys = self._open_cells(max(0, gy - 12), gy, 3, w - 3, floor)
+        idx = self._pick(len(xs), self.cfg.num_containers)
+        self.container_x, self.container_y = xs[idx], ys[idx]
+        self.container_type = self.rng.choices(["crate", "crate", "locker", "rubble_pile"], k=len(idx))
+        self.grid[self.container_y, self.container_x] = T_CONTAINER
 
     def _place_balloon_crates(self):
-        w, h = self.cfg.width, self.cfg.height
-        gy = self.cfg.ground_y
-        placed = 0
+        w = self.cfg.width
+        by = self.cfg.ground_y - 1
+        x0, x1 = 10, w - 9
 
-        for _ in range(100):
-            if placed >= self.cfg.num_balloon_crates:
-                break
-            bx = self.rng.randint(10, w - 10)
-            by = gy - 1
-            if 0 <= by < h and self.grid[by][bx] == T_AIR:
-                # Check clear sky above
-                clear = True
-                for y in range(0, by):
-                    if self.grid[y][bx] != T_AIR:
-                        clear = False
-                        break
-                if clear and by + 1 < h and self.grid[by + 1][bx] in (T_FILL, T_ROAD, T_FLOOR):
-                    self.grid[by][bx] = T_BALLOON_CRATE
-                    self.balloon_positions.append((bx, by))
-                    placed += 1
+        # Ground-level air with clear sky above and ground/road/floor below
+        clear = (self.grid[:by + 1, x0:x1] == T_AIR).all(axis=0)
+        ok = clear & _IS_GROUND[self.grid[by + 1, x0:x1]]
+        cols = (np.flatnonzero(ok) + x0).astype(np.int16)
+        self.balloon_x = cols[self._pick(len(cols), self.cfg.num_balloon_crates)]
+        self.balloon_y = np.full(len(self.balloon_x), by, dtype=np.int16)
+        self.grid[by, self.balloon_x] = T_BALLOON_CRATE
 
     def _place_ground_loot(self):
-        w, h = self.cfg.width, self.cfg.height
+        w = self.cfg.width
         gy = self.cfg.ground_y
         loot_items = ["scrap_wood", "scrap_metal", "scrap_wood", "scrap_electronics"]
-        placed = 0
-        for _ in range(200):
-            if placed >= 8:
-                break
-            lx = self.rng.randint(5, w - 5)
-            ly = self.rng.randint(max(0, gy - 10), gy - 1)
-            if 0 <= ly < h and self.grid[ly][lx] == T_AIR:
-                if ly + 1 < h and self.grid[ly + 1][lx] not in (T_AIR, T_SPAWN, T_CONTAINER, T_BALLOON_CRATE):
-                    item = self.rng.choice(loot_items)
-                    self.ground_items.append((lx, ly, item))
-                    placed += 1
+
+        floor = _IS_FLOOR[self.grid]
+        xs, ys = self._open_cells(max(0, gy - 10), gy, 5, w - 4, floor)
+        idx = self._pick(len(xs), 8)
+        self.loot_x, self.loot_y = xs[idx], ys[idx]
+        self.loot_item = self.rng.choices(loot_items, k=len(idx))
 
     def _place_siren_zones(self):
         w = self.cfg.width
         # Place siren zones away from spawn (which will be near left edge)
         num_zones = 4
-        for i in range(num_zones):
-            zx = self.rng.randint(w // 3, w - 10)
-            zy = self.cfg.ground_y - 2
-            self.siren_spawn_zones.append((zx, zy))
+        self.siren_zone_x = self.nprng.integers(w // 3, w - 9, size=num_zones).astype(np.int16)
+        self.siren_zone_y = np.full(num_zones, self.cfg.ground_y - 2, dtype=np.int16)
 
     def _place_spawn(self):
-        gy = self.cfg.ground_y
-        # Spawn near left edge in open area
-        for x in range(5, 20):
-            y = gy - 1
-            if 0 <= y < self.cfg.height and self.grid[y][x] == T_AIR:
-                # Check ground below
-                if y + 1 < self.cfg.height and self.grid[y + 1][x] in (T_FILL, T_ROAD, T_FLOOR):
-                    self.grid[y][x] = T_SPAWN
+        gy, h = self.cfg.ground_y, self.cfg.height
+        grid = self.grid
+        y = gy - 1
+        # Spawn near left edge in open area, with ground below
+        if 0 <= y and y + 1 < h:
+            row, below = grid[y], grid[y + 1]
+            for x in range(5, 20):
+                if row[x] == T_AIR and _IS_GROUND[below[x]]:
+                    row[x] = T_SPAWN
                     self.spawn_pos = (x, y)
                     return
         # Fallback
-        self.grid[gy - 1][5] = T_SPAWN
+        self.grid[gy - 1, 5] = T_SPAWN
         self.spawn_pos = (5, gy - 1)
 
     def _top_detection(self):
-        h, w = self.cfg.height, self.cfg.width
-        for y in range(1, h):
-            for x in range(w):
-                if self.grid[y][x] == T_FILL and self.grid[y - 1][x] in (T_AIR, T_SPAWN):
-                    self.grid[y][x] = T_TOP
+        # Fill tiles whose upper neighbour is open become surface tiles
+        above = self.grid[:-1]
+        here = self.grid[1:]
+        mask = (here == T_FILL) & ((above == T_AIR) | (above == T_SPAWN))
+        here[mask] = T_TOP
 
 
 # ── Export ───────────────────────────────────────────────────────────────────
 
-def export_csv(grid: list[list[int]], path: str):
-    with open(path, "w") as f:
-        for row in grid:
-            f.write(",".join(str(v) for v in row))
-            f.write("\n")
-
-
-def export_png(grid: list[list[int]], path: str, scale: int = 4):
-    h = len(grid)
-    w = len(grid[0]) if h > 0 else 0
-    img = Image.new("RGBA", (w, h))
-    pixels = img.load()
-    for y in range(h):
-        for x in range(w):
-            tile = grid[y][x]
-            color = TILE_COLORS.get(tile, (255, 0, 255))
-            if len(color) == 3:
-                color = color + (255,)
-            pixels[x, y] = color
+# RGBA per tile id; ids without a colour export as magenta
+_PALETTE = np.full((256, 4), (255, 0, 255, 255), dtype=np.uint8)
+for _tile, _color in TILE_COLORS.items():
+    _PALETTE[_tile] = (*_color[:3], _color[3] if len(_color) == 4 else 255)
+# Same table with each RGBA entry packed into one uint32 (a view, so byte
+# order in memory stays R, G, B, A on any platform)
+_PALETTE_U32 = _PALETTE.view(np.uint32).ravel()
+
+def export_csv(grid: np.ndarray, path: str):
+    np.savetxt(path, np.asarray(grid, dtype=np.uint8), fmt="%d", delimiter=",")
+
+
+def export_png(grid: np.ndarray, path: str, scale: int = 4):
+    grid = np.asarray(grid, dtype=np.uint8)
+    h, w = grid.shape
+    rgba = _PALETTE_U32[grid]  # one 32-bit gather per tile
+    img = Image.frombuffer("RGBA", (w, h), rgba, "raw", "RGBA", 0, 1)
     img = img.resize((w * scale, h * scale), Image.NEAREST)
     img.save(path)
 
@@ -7,11 +7,11 @@ Generates explorable underground terrain and exports as PNG, CSV, and TMX.
 import argparse
 import os
 import xml.etree.ElementTree as ET
-from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from PIL import Image
 
 # ── Tile constants ──────────────────────────────────────────────────────────
@@ -65,6 +65,61 @@ class BlueprintConfig:
     png_scale: int = 4
 
 
+# ── Region labelling ────────────────────────────────────────────────────────
+
+def label_regions(mask: np.ndarray) -> tuple[np.ndarray, int]:
+    """4-connected component labelling of a boolean mask.
+
+    Returns (labels, n): int32 labels with 0 for background and 1..n per
+    component, numbered in raster order of each component's first cell
+    (the scipy.ndimage.label convention). Works on horizontal runs, so the
+    Python-level work is per run rather than per cell.
+    """
+    h, w = mask.shape
+    padded = np.zeros((h, w + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    edges = np.diff(padded, axis=1)
+    run_rows, run_starts = np.nonzero(edges == 1)  # runs cover [start, end)
+    run_ends = np.nonzero(edges == -1)[1]
+    n_runs = len(run_rows)
+
+    # Union-find over runs; the root is always the lowest (earliest) run
+    parent = list(range(n_runs))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    starts, ends = run_starts.tolist(), run_ends.tolist()
+    row_first = np.searchsorted(run_rows, np.arange(h + 1)).tolist()
+    for y in range(1, h):
+        i, i_end = row_first[y - 1], row_first[y]
+        j, j_end = row_first[y], row_first[y + 1]
+        while i < i_end and j < j_end:
+            if starts[i] < ends[j] and starts[j] < ends[i]:  # columns overlap
+                ra, rb = find(i), find(j)
+                if ra < rb:
+                    parent[rb] = ra
+                elif rb < ra:
+                    parent[ra] = rb
+            if ends[i] < ends[j]:
+                i += 1
+            else:
+                j += 1
+
+    roots = np.array([find(i) for i in range(n_runs)], dtype=np.int64)
+    uniq, run_label = np.unique(roots, return_inverse=True)
+
+    # Paint runs: +label at each start, -label at each end, then prefix-sum rows
+    delta = np.zeros((h, w + 1), dtype=np.int32)
+    delta[run_rows, run_starts] = run_label + 1
+    delta[run_rows, run_ends] = -(run_label + 1)
+    labels = np.cumsum(delta[:, :w], axis=1, dtype=np.int32)
+    return labels, len(uniq)
+
+
 # ── Generator ───────────────────────────────────────────────────────────────
 
 class BlueprintGenerator:
@@ -73,6 +128,7 @@ class BlueprintGenerator:
         self.rng = np.random.default_rng(self.cfg.seed)
         self.grid = np.full((self.cfg.height, self.cfg.width), T_FILL, dtype=np.int8)
         self.surface_line: np.ndarray | None = None
+        self.air_labels: np.ndarray | None = None  # step 5 labels, reused by step 6
 
     def generate(self) -> np.ndarray:
         """Run the full 9-step pipeline."""
@@ -99,13 +155,18 @@ class BlueprintGenerator:
         y_min, y_max = self.cfg.surface_y_min, self.cfg.surface_y_max
         step_max = self.cfg.surface_step_max
 
-        surface = np.zeros(w, dtype=np.int32)
-        y = self.rng.integers(y_min, y_max + 1)
-        for x in range(w):
-            dy = self.rng.integers(-step_max, step_max + 1)
-            y = int(np.clip(y + dy, y_min, y_max))
-            surface[x] = y
-            self.grid[:y, x] = T_AIR
+        y = int(self.rng.integers(y_min, y_max + 1))
+        # One batched draw yields the same stream as W scalar draws; the
+        # clamped walk itself is order-dependent, so it stays a tight int loop
+        steps = self.rng.integers(-step_max, step_max + 1, size=w).tolist()
+        heights = []
+        for dy in steps:
+            y = min(max(y + dy, y_min), y_max)
+            heights.append(y)
+        surface = np.array(heights, dtype=np.int32)
+
+        # Everything above the surface line is air
+        self.grid[np.arange(h)[:, None] < surface[None, :]] = T_AIR
 
         self.surface_line = surface
 
@@ -123,48 +184,46 @@ class BlueprintGenerator:
             self._carve_tunnel(int(sx), min_w, clearance)
 
     def _carve_tunnel(self, start_x: int, min_w: int, clearance: int):
+        # Inherently serial random walk: keep everything the loop touches in locals
         w, h = self.cfg.width, self.cfg.height
+        grid = self.grid
+        rand = self.rng.random
+        branch_chance = self.cfg.tunnel_branch_chance
         x = start_x
         y = int(self.surface_line[start_x])
         half = min_w // 2
+        x_hi = w - 1 - half  # walk stays within [half, x_hi]
 
         max_depth = h - 5
         while y < max_depth:
-            # Carve a cross-section
-            for dx in range(-half, half + 1):
-                for dy in range(clearance):
-                    cx, cy = x + dx, y + dy
-                    if 0 <= cx < w and 0 <= cy < h:
-                        self.grid[cy, cx] = T_AIR
+            # Carve a cross-section (x stays >= half, so the slice never wraps)
+            grid[y:y + clearance, x - half:x + half + 1] = T_AIR
 
             # Biased random walk: mostly down, sometimes sideways
-            direction = self.rng.random()
+            direction = rand()
             if direction < 0.6:
                 y += 1
-            elif direction < 0.8:
-                x = max(half, min(x - 1, w - 1 - half))
             else:
-                x = max(half, min(x + 1, w - 1 - half))
+                x = x - 1 if direction < 0.8 else x + 1
+                x = x_hi if x > x_hi else x
+                x = half if x < half else x
 
             # Random step size for variety
-            if self.rng.random() < 0.3:
+            if rand() < 0.3:
                 y += 1
 
             # Optional branch
-            if self.rng.random() < self.cfg.tunnel_branch_chance and y < h - 20:
-                branch_len = self.rng.integers(10, 30)
+            if rand() < branch_chance and y < h - 20:
+                branch_len = int(self.rng.integers(10, 30))
                 bx, by = x, y
-                branch_dir = self.rng.choice([-1, 1])
+                branch_dir = int(self.rng.choice([-1, 1]))
                 for _ in range(branch_len):
-                    for dx in range(-half, half + 1):
-                        for dy in range(clearance):
-                            cx, cy = bx + dx, by + dy
-                            if 0 <= cx < w and 0 <= cy < h:
-                                self.grid[cy, cx] = T_AIR
+                    grid[by:by + clearance, bx - half:bx + half + 1] = T_AIR
                     bx += branch_dir
-                    if self.rng.random() < 0.4:
+                    if rand() < 0.4:
                         by += 1
-                    bx = max(half, min(bx, w - 1 - half))
+                    bx = x_hi if bx > x_hi else bx
+                    bx = half if bx < half else bx
                     if by >= h - 2:
                         break
 
@@ -179,9 +238,25 @@ class BlueprintGenerator:
 
         surface_max = int(self.surface_line.max()) + 10
 
+        # Angle/distance tables for the largest bounding box, shared by every
+        # cave; offsets run from -(r_max + 2) to r_max + 1 around the centre
+        num_angles = 36
+        pad = r_max + 2
+        off = np.arange(-pad, pad)
+        dy_lut = off[:, None]
+        dx_lut = off[None, :]
+        angle = np.arctan2(dy_lut, dx_lut) % (2 * np.pi)
+        # The two nearest angle samples and the interpolation weight between them
+        idx = angle / (2 * np.pi) * num_angles
+        whole = idx.astype(np.int64)
+        i0_lut = whole % num_angles
+        i1_lut = (i0_lut + 1) % num_angles
+        frac_lut = idx - whole
+        dist2_lut = dx_lut * dx_lut + dy_lut * dy_lut
+
         for _ in range(n):
-            cx = self.rng.integers(r_max + 2, w - r_max - 2)
-            cy = self.rng.integers(surface_max, h - r_max - 2)
+            cx = int(self.rng.integers(r_max + 2, w - r_max - 2))
+            cy = int(self.rng.integers(surface_max, h - r_max - 2))
 
             # Deeper caves tend to be larger
             depth_ratio = (cy - surface_max) / max(1, h - surface_max - r_max)
@@ -189,74 +264,40 @@ class BlueprintGenerator:
             base_r = max(r_min, min(base_r, r_max))
 
             # Per-angle radius noise for organic shapes
-            num_angles = 36
-            angles = np.linspace(0, 2 * np.pi, num_angles, endpoint=False)
             radii = base_r * (1.0 + noise * (self.rng.random(num_angles) * 2 - 1))
 
-            for y in range(max(0, int(cy - r_max - 2)), min(h, int(cy + r_max + 2))):
-                for x in range(max(0, int(cx - r_max - 2)), min(w, int(cx + r_max + 2))):
-                    dx = x - cx
-                    dy = y - cy
-                    angle = np.arctan2(dy, dx) % (2 * np.pi)
-                    # Find the two nearest angle samples and interpolate
-                    idx = angle / (2 * np.pi) * num_angles
-                    i0 = int(idx) % num_angles
-                    i1 = (i0 + 1) % num_angles
-                    frac = idx - int(idx)
-                    r = radii[i0] * (1 - frac) + radii[i1] * frac
-                    if dx * dx + dy * dy < r * r:
-                        self.grid[y, x] = T_AIR
+            # Rasterize the bounding box in one shot
+            y0, y1 = max(0, cy - pad), min(h, cy + pad)
+            x0, x1 = max(0, cx - pad), min(w, cx + pad)
+            lut = (slice(y0 - cy + pad, y1 - cy + pad), slice(x0 - cx + pad, x1 - cx + pad))
+            frac = frac_lut[lut]
+            r = radii[i0_lut[lut]] * (1 - frac) + radii[i1_lut[lut]] * frac
+            self.grid[y0:y1, x0:x1][dist2_lut[lut] < r * r] = T_AIR
 
     # Step 5: Filter small regions ────────────────────────────────────────────
 
     def _step5_filter(self):
-        """BFS flood fill; fill back regions smaller than min_region_size."""
-        w, h = self.cfg.width, self.cfg.height
-        visited = np.zeros((h, w), dtype=bool)
-
-        for y in range(h):
-            for x in range(w):
-                if self.grid[y, x] == T_AIR and not visited[y, x]:
-                    region = self._bfs_flood(x, y, visited)
-                    if len(region) < self.cfg.min_region_size:
-                        for rx, ry in region:
-                            self.grid[ry, rx] = T_FILL
-
-    def _bfs_flood(self, sx: int, sy: int, visited: np.ndarray) -> list[tuple[int, int]]:
-        """BFS flood fill from (sx, sy), returns list of air coordinates."""
-        w, h = self.cfg.width, self.cfg.height
-        queue = deque([(sx, sy)])
-        visited[sy, sx] = True
-        region = []
-
-        while queue:
-            x, y = queue.popleft()
-            region.append((x, y))
-            for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
-                if 0 <= nx < w and 0 <= ny < h and not visited[ny, nx] and self.grid[ny, nx] == T_AIR:
-                    visited[ny, nx] = True
-                    queue.append((nx, ny))
-
-        return region
+        """Label air regions; fill back those smaller than min_region_size."""
+        labels, n = label_regions(self.grid == T_AIR)
+        small = np.bincount(labels.ravel(), minlength=n + 1) < self.cfg.min_region_size
+        small[0] = False  # background (solid)
+        filled = small[labels]
+        self.grid[filled] = T_FILL
+        labels[filled] = 0
+        self.air_labels = labels
 
     # Step 6: Connect ─────────────────────────────────────────────────────────
 
     def _step6_connect(self):
         """Ensure all air regions connect to the surface sky region."""
-        w, h = self.cfg.width, self.cfg.height
-
-        regions = self._find_air_regions()
+        # Step 5 only filled whole regions, so its labels are still exact
+        regions = self._find_air_regions(self.air_labels)
         if len(regions) <= 1:
             return
 
-        # The surface region is the one containing the topmost air tile
+        # The surface region is the one containing the topmost air tile;
+        # regions come in raster order, so that is always the first one
         surface_region_idx = 0
-        min_y = h
-        for i, region in enumerate(regions):
-            for x, y in region:
-                if y < min_y:
-                    min_y = y
-                    surface_region_idx = i
 
         # Connect each non-surface region to the surface region
         surface_set = set(regions[surface_region_idx])
@@ -264,38 +305,39 @@ class BlueprintGenerator:
             if i == surface_region_idx:
                 continue
             # Find closest pair of tiles between this region and the surface region
-            best_dist = float("inf")
-            best_a = best_b = None
             # Sample to keep it fast
             sample_size = min(200, len(region))
-            sample_region = [region[j] for j in self.rng.choice(len(region), sample_size, replace=False)]
+            sample_region = np.array(region)[self.rng.choice(len(region), sample_size, replace=False)]
             surface_list = list(surface_set)
-            sample_surface = [surface_list[j] for j in self.rng.choice(len(surface_list), min(200, len(surface_list)), replace=False)]
-
-            for ax, ay in sample_region:
-                for bx, by in sample_surface:
-                    d = abs(ax - bx) + abs(ay - by)
-                    if d < best_dist:
-                        best_dist = d
-                        best_a = (ax, ay)
-                        best_b = (bx, by)
-
-            if best_a and best_b:
-                self._carve_l_tunnel(best_a, best_b)
-                # Merge into surface set
-                surface_set.update(region)
-
-    def _find_air_regions(self) -> list[list[tuple[int, int]]]:
-        w, h = self.cfg.width, self.cfg.height
-        visited = np.zeros((h, w), dtype=bool)
-        regions = []
-
-        for y in range(h):
-            for x in range(w):
-                if self.grid[y, x] == T_AIR and not visited[y, x]:
-                    region = self._bfs_flood(x, y, visited)
-                    regions.append(region)
+            sample_surface = np.array(surface_list)[
+                self.rng.choice(len(surface_list), min(200, len(surface_list)), replace=False)
+            ]
+
+            # All pairwise Manhattan distances at once; argmin keeps the first
+            # closest pair in (region, surface) order
+            dist = np.abs(sample_region[:, None, :] - sample_surface[None, :, :]).sum(axis=2)
+            i, j = np.unravel_index(int(dist.argmin()), dist.shape)
+            best_a = tuple(sample_region[i].tolist())
+            best_b = tuple(sample_surface[j].tolist())
+
+            self._carve_l_tunnel(best_a, best_b)
+            # Merge into surface set
+            surface_set.update(region)
+
+    def _find_air_regions(self, labels: np.ndarray) -> list[list[tuple[int, int]]]:
+        """Return the (x, y) cells of each labelled air region, regions in raster order."""
+        ys, xs = np.nonzero(labels)
+        region_of = labels[ys, xs]
+        order = np.argsort(region_of, kind="stable")  # group by region, keep raster order
+        xs, ys = xs[order].tolist(), ys[order].tolist()
 
+        regions = []
+        i = 0
+        for count in np.bincount(region_of)[1:].tolist():
+            if not count:
+                continue  # label freed by the small-region filter
+            regions.append(list(zip(xs[i:i + count], ys[i:i + count])))
+            i += count
         return regions
 
     def _carve_l_tunnel(self, a: tuple[int, int], b: tuple[int, int]):
@@ -303,24 +345,14 @@ class BlueprintGenerator:
         ax, ay = a
         bx, by = b
         half = self.cfg.tunnel_min_width // 2
-        clearance = self.cfg.tunnel_vertical_clearance
-        w, h = self.cfg.width, self.cfg.height
 
-        # Horizontal leg
-        x_start, x_end = min(ax, bx), max(ax, bx)
-        for x in range(x_start, x_end + 1):
-            for dy in range(-half, half + 1):
-                cy = ay + dy
-                if 0 <= x < w and 0 <= cy < h:
-                    self.grid[cy, x] = T_AIR
-
-        # Vertical leg
-        y_start, y_end = min(ay, by), max(ay, by)
-        for y in range(y_start, y_end + 1):
-            for dx in range(-half, half + 1):
-                cx = bx + dx
-                if 0 <= cx < w and 0 <= y < h:
-                    self.grid[y, cx] = T_AIR
+        # Horizontal leg: a (2*half+1)-tall band along row ay
+        x_lo, x_hi = max(0, min(ax, bx)), max(ax, bx) + 1
+        self.grid[max(0, ay - half):ay + half + 1, x_lo:x_hi] = T_AIR
+
+        # Vertical leg: a (2*half+1)-wide band along column bx
+        y_lo, y_hi = max(0, min(ay, by)), max(ay, by) + 1
+        self.grid[y_lo:y_hi, max(0, bx - half):bx + half + 1] = T_AIR
 
     # Step 7: Surface entry check ─────────────────────────────────────────────
 
@@ -357,38 +389,27 @@ class BlueprintGenerator:
 
         # Spawn: flattest surface near horizontal center
         center_x = w // 2
-        best_score = float("inf")
         spawn_x = center_x
 
-        for x in range(max(5, center_x - w // 4), min(w - 5, center_x + w // 4)):
-            # Flatness = max height difference in a 5-tile window
-            window = self.surface_line[max(0, x - 2):x + 3]
-            flatness = int(window.max() - window.min())
-            dist = abs(x - center_x)
-            score = flatness * 10 + dist
-            if score < best_score:
-                best_score = score
-                spawn_x = x
+        xs = np.arange(max(5, center_x - w // 4), min(w - 5, center_x + w // 4))
+        if xs.size:
+            # Flatness = max height difference in a 5-tile window centred on x
+            windows = sliding_window_view(self.surface_line.astype(np.int64), 5)[xs - 2]
+            flatness = windows.max(axis=1) - windows.min(axis=1)
+            scores = flatness * 10 + np.abs(xs - center_x)
+            spawn_x = int(xs[scores.argmin()])
 
         spawn_y = int(self.surface_line[spawn_x]) - 1
         self.grid[spawn_y, spawn_x] = T_SPAWN
 
-        # Goal: deepest air tile, far from spawn
-        best_goal = None
-        best_goal_score = -1.0
-
-        for y in range(h - 1, -1, -1):
-            for x in range(w):
-                if self.grid[y, x] == T_AIR:
-                    depth = y
-                    dist = abs(x - spawn_x) + abs(y - spawn_y)
-                    score = depth * 2 + dist
-                    if score > best_goal_score:
-                        best_goal_score = score
-                        best_goal = (x, y)
-
-        if best_goal:
-            self.grid[best_goal[1], best_goal[0]] = T_GOAL
+        # Goal: deepest air tile, far from spawn. Scan bottom-up so argmax's
+        # first-hit tie-break matches a deepest-row-first search.
+        rows, xs = np.nonzero(self.grid[::-1] == T_AIR)
+        if xs.size:
+            ys = (h - 1) - rows
+            scores = ys * 2 + np.abs(xs - spawn_x) + np.abs(ys - spawn_y)
+            best = int(scores.argmax())
+            self.grid[ys[best], xs[best]] = T_GOAL
 
     # Step 9: T_TOP detection ─────────────────────────────────────────────────
 
@@ -398,30 +419,29 @@ class BlueprintGenerator:
         air_above = self.grid[:-1, :] == T_AIR  # rows 0..h-2
         is_fill = self.grid[1:, :] == T_FILL    # rows 1..h-1
         mask = air_above & is_fill
-        self.grid[1:, :] = np.where(mask, T_TOP, self.grid[1:, :])
+        self.grid[1:, :][mask] = T_TOP
 
 
 # ── Export functions ────────────────────────────────────────────────────────
 
+# RGBA per tile id for export_png; unknown ids are magenta
+_PALETTE = np.full((256, 4), (255, 0, 255, 255), dtype=np.uint8)
+for _tile, _color in TILE_COLORS.items():
+    _PALETTE[_tile] = _color
+# Same table packed one RGBA pixel per uint32, so a gather moves one word per tile
+_PALETTE_U32 = _PALETTE.view(np.uint32).ravel()
+
 def export_png(grid: np.ndarray, path: str, scale: int = 4):
     h, w = grid.shape
-    img = Image.new("RGBA", (w, h))
-    pixels = img.load()
-
-    for y in range(h):
-        for x in range(w):
-            pixels[x, y] = TILE_COLORS.get(int(grid[y, x]), (255, 0, 255, 255))
-
+    pixels = _PALETTE_U32[grid.astype(np.uint8, copy=False)]  # (h, w) packed RGBA
+    img = Image.frombuffer("RGBA", (w, h), pixels, "raw", "RGBA", 0, 1)
     img = img.resize((w * scale, h * scale), Image.NEAREST)
-    img.save(path)
+    # Debug preview: zlib dominates export time, so trade file size for speed
+    img.save(path, compress_level=1)
 
 
 def export_csv(grid: np.ndarray, path: str):
-    h, w = grid.shape
-    with open(path, "w") as f:
-        for y in range(h):
-            f.write(",".join(str(grid[y, x]) for x in range(w)))
-            f.write("\n")
+    np.savetxt(path, grid, fmt="%d", delimiter=",")
 
 
 def export_tmx(grid: np.ndarray, path: str):
@@ -458,10 +478,8 @@ def export_tmx(grid: np.ndarray, path: str):
         "height": str(h),
     })
     data = ET.SubElement(layer, "data", {"encoding": "csv"})
-    rows = []
-    for y in range(h):
-        rows.append(",".join(str(int(grid[y, x]) + 1) for x in range(w)))
-    data.text = "\n" + "\n".join(rows) + "\n"
+    rows = (grid.astype(np.int32) + 1).tolist()
+    data.text = "\n" + "\n".join([",".join(map(str, row)) for row in rows]) + "\n"
 
     # Object layer for spawn/goal markers
     obj_layer = ET.SubElement(tmx_map, "objectgroup", {
@@ -470,9 +488,7 @@ def export_tmx(grid: np.ndarray, path: str):
     })
 
     obj_id = 1
-    spawn_positions = np.argwhere(grid == T_SPAWN)
-    for pos in spawn_positions:
-        y, x = pos
+    for y, x in np.argwhere(grid == T_SPAWN).tolist():
         ET.SubElement(obj_layer, "object", {
             "id": str(obj_id),
             "name": "spawn",
@@ -484,9 +500,7 @@ def export_tmx(grid: np.ndarray, path: str):
         })
         obj_id += 1
 
-    goal_positions = np.argwhere(grid == T_GOAL)
-    for pos in goal_positions:
-        y, x = pos
+    for y, x in np.argwhere(grid == T_GOAL).tolist():
         ET.SubElement(obj_layer, "object", {
             "id": str(obj_id),
             "name": "goal",
@@ -507,26 +521,12 @@ def export_tmx(grid: np.ndarray, path: str):
 
 def verify_blueprint(grid: np.ndarray, surface_line: np.ndarray) -> list[str]:
     """Run structural invariant checks. Returns list of failure messages (empty = pass)."""
-    h, w = grid.shape
+    h = grid.shape[0]
     failures = []
 
     # 1. Single connected air region
     air_mask = np.isin(grid, [T_AIR, T_TOP, T_SPAWN, T_GOAL])
-    visited = np.zeros((h, w), dtype=bool)
-    region_count = 0
-
-    for y in range(h):
-        for x in range(w):
-            if air_mask[y, x] and not visited[y, x]:
-                queue = deque([(x, y)])
-                visited[y, x] = True
-                while queue:
-                    cx, cy = queue.popleft()
-                    for nx, ny in ((cx - 1, cy), (cx + 1, cy), (cx, cy - 1), (cx, cy + 1)):
-                        if 0 <= nx < w and 0 <= ny < h and not visited[ny, nx] and air_mask[ny, nx]:
-                            visited[ny, nx] = True
-                            queue.append((nx, ny))
-                region_count += 1
+    _, region_count = label_regions(air_mask)
 
     if region_count != 1:
         failures.append(f"Expected 1 connected air region, found {region_count}")
@@ -555,16 +555,10 @@ def verify_blueprint(grid: np.ndarray, surface_line: np.ndarray) -> list[str]:
             failures.append(f"Goal at y={gy} not deep enough (min expected: {min_goal_depth})")
 
     # 4. T_TOP tiles always have air/spawn above
-    for y in range(1, h):
-        for x in range(w):
-            if grid[y, x] == T_TOP:
-                above = grid[y - 1, x]
-                if above not in (T_AIR, T_SPAWN, T_GOAL):
-                    failures.append(f"T_TOP at ({x},{y}) has non-air tile above: {above}")
-                    break
-        else:
-            continue
-        break  # Only report first failure
+    bad = (grid[1:] == T_TOP) & ~np.isin(grid[:-1], [T_AIR, T_SPAWN, T_GOAL])
+    if bad.any():
+        y, x = np.argwhere(bad)[0].tolist()  # only report first failure (row-major)
+        failures.append(f"T_TOP at ({x},{y + 1}) has non-air tile above: {grid[y, x]}")
 
     # 5. Vertical clearance spot check: pick some T_TOP tiles, check 3 tiles of air above
     top_positions = np.argwhere(grid == T_TOP)
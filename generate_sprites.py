@@ -5,11 +5,23 @@ Run once (or re-run) to generate all PNG assets into assets/.
 Uses Pillow only — no external art required.
 """
 
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import sys
 from pathlib import Path
 
+import PIL
 from PIL import Image, ImageDraw
 
 ASSETS = Path(__file__).parent / "assets"
+MANIFEST = ASSETS / ".manifest.json"
+ATLAS_NAME = "atlas"
+ATLAS_WIDTH = 256
+
+_saved: list[str] = []  # names written by the gen_* function currently running
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
@@ -20,7 +32,9 @@ def make(w: int, h: int) -> tuple[Image.Image, ImageDraw.ImageDraw]:
 
 
 def save(img: Image.Image, name: str):
-    img.save(ASSETS / f"{name}.png")
+    # Sprites are tiny; zlib's default search effort buys almost nothing here
+    img.save(ASSETS / f"{name}.png", compress_level=1)
+    _saved.append(name)
 
 
 # ── Tiles (16x16) ───────────────────────────────────────────────────────────
@@ -521,21 +535,91 @@ def gen_ui():
 # ── Main ─────────────────────────────────────────────────────────────────────
 
 
+def _source_hash(fn) -> str:
+    """Hash a generator's source plus the helpers it draws with."""
+    module = sys.modules[__name__]
+    src = inspect.getsource(fn)
+    parts = [PIL.__version__, inspect.getsource(make), inspect.getsource(save), src]
+    for name in sorted(vars(module)):
+        if name.startswith("_draw_") and name in src:
+            parts.append(inspect.getsource(getattr(module, name)))
+    return hashlib.blake2b("\0".join(parts).encode()).hexdigest()
+
+
+def _load_manifest() -> dict:
+    try:
+        return json.loads(MANIFEST.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_manifest(manifest: dict):
+    tmp = MANIFEST.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    os.replace(tmp, MANIFEST)
+
+
+def build_atlas():
+    """Shelf-pack every sprite PNG into atlas.png with an atlas.json {name: [x, y, w, h]} index."""
+    images = [(p.stem, Image.open(p).convert("RGBA"))
+              for p in sorted(ASSETS.glob("*.png")) if p.stem != ATLAS_NAME]
+    # Tallest first keeps shelves tight
+    images.sort(key=lambda item: (-item[1].height, item[0]))
+
+    index = {}
+    x = y = shelf_h = 0
+    for name, img in images:
+        if x + img.width > ATLAS_WIDTH:
+            x, y, shelf_h = 0, y + shelf_h, 0
+        index[name] = [x, y, img.width, img.height]
+        x += img.width
+        shelf_h = max(shelf_h, img.height)
+
+    atlas = Image.new("RGBA", (ATLAS_WIDTH, y + shelf_h), (0, 0, 0, 0))
+    for name, img in images:
+        atlas.paste(img, (index[name][0], index[name][1]))
+    atlas.save(ASSETS / f"{ATLAS_NAME}.png", compress_level=1)
+    (ASSETS / f"{ATLAS_NAME}.json").write_text(json.dumps(index, indent=1, sort_keys=True))
+
+
+GENERATORS = [
+    ("tiles", gen_tiles),
+    ("player", gen_player),
+    ("siren", gen_siren),
+    ("items", gen_items),
+    ("objects", gen_objects),
+    ("UI", gen_ui),
+]
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Ash Diver — Sprite Generator")
+    parser.add_argument("--force", action="store_true",
+                        help="Regenerate every sprite even if its source is unchanged")
+    args = parser.parse_args()
+
     ASSETS.mkdir(parents=True, exist_ok=True)
     print("Generating sprites...")
-    gen_tiles()
-    print("  tiles done")
-    gen_player()
-    print("  player done")
-    gen_siren()
-    print("  siren done")
-    gen_items()
-    print("  items done")
-    gen_objects()
-    print("  objects done")
-    gen_ui()
-    print("  UI done")
+    old = {} if args.force else _load_manifest()
+    manifest = {}
+    changed = False
+    for label, fn in GENERATORS:
+        digest = _source_hash(fn)
+        entry = old.get(fn.__name__)
+        if (entry and entry["hash"] == digest
+                and all((ASSETS / f"{name}.png").exists() for name in entry["outputs"])):
+            manifest[fn.__name__] = entry
+            print(f"  {label} unchanged")
+            continue
+        _saved.clear()
+        fn()
+        changed = True
+        manifest[fn.__name__] = {"hash": digest, "outputs": list(_saved)}
+        print(f"  {label} done")
+    if changed or not (ASSETS / f"{ATLAS_NAME}.json").exists():
+        build_atlas()
+        print("  atlas done")
+    _write_manifest(manifest)
     print(f"All sprites saved to {ASSETS}/")
 
 
@@ -1,5 +1,7 @@
 """Ash Diver — HUD overlay + inventory screen."""
 
+import json
+
 import pygame
 
 from settings import (
@@ -7,11 +9,25 @@ from settings import (
 )
 from items import ITEM_DEFS
 
+_QUICKBAR_W = INVENTORY_SIZE * 24 + (INVENTORY_SIZE - 1) * 2
+_EXT_BAR_W = 300
+_EXT_BAR_H = 20
+_EXT_BAR_Y = 60
+
 
 class SpriteCache:
     """Shared sprite loader with caching."""
 
-    _cache: dict[str, pygame.Surface] = {}
+    _cache: dict[str, pygame.Surface | None] = {}  # None = known missing
+    _scaled: dict[tuple[str, tuple[int, int]], pygame.Surface] = {}
+
+    @staticmethod
+    def _finish(surf: pygame.Surface) -> pygame.Surface:
+        """Drop per-pixel alpha from fully opaque sprites (tiles) for SDL's fast blit path."""
+        w, h = surf.get_size()
+        if pygame.mask.from_surface(surf, 254).count() == w * h:
+            return surf.convert()
+        return surf
 
     @classmethod
     def get(cls, name: str) -> pygame.Surface | None:
@@ -19,14 +35,48 @@ class SpriteCache:
             return cls._cache[name]
         path = ASSETS_DIR / f"{name}.png"
         if path.exists():
-            surf = pygame.image.load(str(path)).convert_alpha()
+            surf = cls._finish(pygame.image.load(str(path)).convert_alpha())
             cls._cache[name] = surf
             return surf
+        # Remember misses too, so a missing sprite costs a stat() only once
+        cls._cache[name] = None
         return None
 
+    @classmethod
+    def preload_all(cls):
+        """Load every asset up front so first sight of a sprite doesn't hitch mid-run.
+
+        Sprites packed into atlas.png become subsurfaces of that one texture
+        (shared pixels, one decode); anything not in the atlas loads on its own.
+        Opaque sprites are copied out as plain convert()ed surfaces.
+        """
+        index_path = ASSETS_DIR / "atlas.json"
+        if index_path.exists():
+            atlas = pygame.image.load(str(ASSETS_DIR / "atlas.png")).convert_alpha()
+            for name, rect in json.loads(index_path.read_text()).items():
+                if name not in cls._cache:
+                    cls._cache[name] = cls._finish(atlas.subsurface(pygame.Rect(rect)))
+        for path in ASSETS_DIR.glob("*.png"):
+            if path.stem != "atlas" and path.stem not in cls._cache:
+                cls._cache[path.stem] = cls._finish(pygame.image.load(str(path)).convert_alpha())
+
+    @classmethod
+    def get_scaled(cls, name: str, size: tuple[int, int]) -> pygame.Surface | None:
+        """Sprite resampled to size, scaled once and reused every frame."""
+        key = (name, size)
+        if key in cls._scaled:
+            return cls._scaled[key]
+        surf = cls.get(name)
+        if surf is None:
+            return None
+        scaled = pygame.transform.scale(surf, size)
+        cls._scaled[key] = scaled
+        return scaled
+
     @classmethod
     def clear(cls):
         cls._cache.clear()
+        cls._scaled.clear()
 
 
 class HUD:
@@ -34,11 +84,67 @@ class HUD:
         self.font = pygame.font.SysFont(None, 24)
         self.font_large = pygame.font.SysFont(None, 36)
         self.font_weapon = pygame.font.SysFont(None, 20)
+        # Static labels never change, so rasterize them once
+        self._label_extracting = self.font.render("EXTRACTING...", True, (255, 255, 255))
+        self._label_inventory = self.font_large.render("INVENTORY", True, (255, 255, 255))
+        self._label_swap_hint = self.font_weapon.render("[Q]", True, (120, 120, 140))
+        self._label_close_hint = self.font.render(
+            "Press TAB to close    Q to swap weapon", True, (150, 150, 150))
+        ext_x = (SCREEN_W - _EXT_BAR_W) // 2
+        self._label_extracting_pos = (
+            ext_x + _EXT_BAR_W // 2 - self._label_extracting.get_width() // 2, _EXT_BAR_Y - 20)
+        self._label_inventory_pos = (SCREEN_W // 2 - self._label_inventory.get_width() // 2, 80)
+        self._label_close_hint_pos = (
+            SCREEN_W // 2 - self._label_close_hint.get_width() // 2, SCREEN_H - 50)
+        self._text_cache: dict[tuple, pygame.Surface] = {}
+        self._inv_overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
+        self._inv_overlay.fill((0, 0, 0, 160))
+        # Extraction bar frame + empty track; only the fill varies per frame
+        self._ext_bar_bg = pygame.Surface((_EXT_BAR_W + 4, _EXT_BAR_H + 4))
+        self._ext_bar_bg.fill((40, 40, 50))
+        self._ext_bar_bg.fill((60, 60, 70), (2, 2, _EXT_BAR_W, _EXT_BAR_H))
+        # Stand-in for a missing medkit sprite (the only per-frame fallback;
+        # the others are drawn once into the cached panels)
+        self._fallback_medkit = pygame.Surface((12, 12))
+        self._fallback_medkit.fill((200, 40, 40))
+        # Slot backgrounds pre-composed on first use (sprites need a display)
+        self._quickbar_bg: pygame.Surface | None = None
+        self._inventory_bg: pygame.Surface | None = None
+        # Status panel and quickbar are redrawn only when their inputs change
+        self._status_key: tuple | None = None
+        self._heart_rows: dict[tuple[int, int], pygame.Surface] = {}
+        self._status_panel: pygame.Surface | None = None
+        self._quickbar_key: tuple | None = None
+        self._quickbar_panel: pygame.Surface | None = None
         self.show_inventory = False
         self.extraction_active = False
         self.extraction_timer = 0.0
         self.extraction_total = 0.0
 
+    def _text(self, font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+        """Rendered text, re-rasterized only when the string or colour changes."""
+        key = (font, text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            if len(self._text_cache) >= 256:
+                self._text_cache.clear()
+            surf = self._text_cache[key] = font.render(text, True, color)
+        return surf
+
+    @staticmethod
+    def _compose_slots(size: int, positions: list[tuple[int, int]], w: int, h: int,
+                       fill: tuple, border: tuple) -> pygame.Surface:
+        """One surface holding every slot background, so a bar is a single blit."""
+        surf = pygame.Surface((w, h), pygame.SRCALPHA)
+        slot_bg = SpriteCache.get_scaled("ui_slot", (size, size))
+        for sx, sy in positions:
+            if slot_bg:
+                surf.blit(slot_bg, (sx, sy))
+            else:
+                pygame.draw.rect(surf, fill, (sx, sy, size, size))
+                pygame.draw.rect(surf, border, (sx, sy, size, size), 1)
+        return surf
+
     def toggle_inventory(self):
         self.show_inventory = not self.show_inventory
 
@@ -48,58 +154,83 @@ class HUD:
         self.extraction_total = total
 
     def render(self, screen: pygame.Surface, player):
-        self._render_hp_and_weapon(screen, player)
+        key = (player.hp, player.max_hp, player.weapon, player.weapon_display_name)
+        if key != self._status_key:
+            self._status_key = key
+            self._status_panel = self._draw_status_panel(player)
+        screen.blit(self._status_panel, (10, 8))
         self._render_ammo(screen, player)
         self._render_medkits(screen, player)
-        self._render_quickbar(screen, player)
+        key = tuple((slot.item_id, slot.count) if slot else None for slot in player.inventory)
+        if key != self._quickbar_key:
+            self._quickbar_key = key
+            self._quickbar_panel = self._draw_quickbar_panel(player)
+        screen.blit(self._quickbar_panel, ((SCREEN_W - _QUICKBAR_W) // 2, SCREEN_H - 32))
         if self.extraction_active:
             self._render_extraction_bar(screen)
         if self.show_inventory:
             self._render_inventory_screen(screen, player)
 
-    def _render_hp_and_weapon(self, screen: pygame.Surface, player):
-        """Hearts on the left, weapon icon + name right next to them."""
+    def _heart_row(self, hp: int, max_hp: int) -> pygame.Surface:
+        """Full/empty hearts for one HP value, composed once per (hp, max_hp)."""
+        key = (hp, max_hp)
+        row = self._heart_rows.get(key)
+        if row is not None:
+            return row
+        row = pygame.Surface((max_hp * 16, 12), pygame.SRCALPHA)
         heart = SpriteCache.get("ui_heart")
         heart_empty = SpriteCache.get("ui_heart_empty")
-        x = 10
-        y = 10
-        for i in range(player.max_hp):
-            sprite = heart if i < player.hp else heart_empty
+        for i in range(max_hp):
+            sprite = heart if i < hp else heart_empty
             if sprite:
-                screen.blit(sprite, (x + i * 16, y))
+                row.blit(sprite, (i * 16, 0))
             else:
-                color = (220, 40, 40) if i < player.hp else (80, 30, 30)
-                pygame.draw.rect(screen, color, (x + i * 16, y, 12, 12))
+                color = (220, 40, 40) if i < hp else (80, 30, 30)
+                pygame.draw.rect(row, color, (i * 16, 0, 12, 12))
+        self._heart_rows[key] = row
+        return row
+
+    def _draw_status_panel(self, player) -> pygame.Surface:
+        """Hearts on the left, weapon icon + name right next to them.
+
+        Drawn into a panel whose origin sits at screen (10, 8).
+        """
+        name_text = self._text(self.font_weapon, player.weapon_display_name, (200, 200, 210))
+        panel_w = player.max_hp * 16 + 12 + 32 + name_text.get_width() + 4 + self._label_swap_hint.get_width()
+        screen = pygame.Surface((panel_w, 28), pygame.SRCALPHA)
+
+        x = 0
+        y = 2
+        screen.blit(self._heart_row(player.hp, player.max_hp), (x, y))
 
         # Weapon icon + name right after hearts
         wx = x + player.max_hp * 16 + 12
         wy = y - 2
 
         # Slot background
-        slot_bg = SpriteCache.get("ui_slot")
+        slot_bg = SpriteCache.get_scaled("ui_slot", (28, 28))
         if slot_bg:
-            screen.blit(pygame.transform.scale(slot_bg, (28, 28)), (wx, wy))
+            screen.blit(slot_bg, (wx, wy))
         else:
             pygame.draw.rect(screen, (40, 40, 55), (wx, wy, 28, 28))
             pygame.draw.rect(screen, (100, 100, 120), (wx, wy, 28, 28), 1)
 
         # Weapon sprite
         if player.weapon:
-            wep_sprite = SpriteCache.get(f"item_{player.weapon}")
+            wep_sprite = SpriteCache.get_scaled(f"item_{player.weapon}", (22, 22))
             if wep_sprite:
-                screen.blit(pygame.transform.scale(wep_sprite, (22, 22)), (wx + 3, wy + 3))
+                screen.blit(wep_sprite, (wx + 3, wy + 3))
         else:
             # Fist icon: just draw a small fist shape
             pygame.draw.circle(screen, (200, 180, 160), (wx + 14, wy + 14), 8)
             pygame.draw.circle(screen, (180, 160, 140), (wx + 14, wy + 14), 8, 1)
 
         # Weapon name
-        name_text = self.font_weapon.render(player.weapon_display_name, True, (200, 200, 210))
         screen.blit(name_text, (wx + 32, wy + 6))
 
         # Swap hint
-        hint = self.font_weapon.render("[Q]", True, (120, 120, 140))
-        screen.blit(hint, (wx + 32 + name_text.get_width() + 4, wy + 6))
+        screen.blit(self._label_swap_hint, (wx + 32 + name_text.get_width() + 4, wy + 6))
+        return screen
 
     def _render_ammo(self, screen: pygame.Surface, player):
         """Ammo count below HP/weapon row, only when holding ranged weapon."""
@@ -111,7 +242,7 @@ class HUD:
         if ammo_icon:
             screen.blit(ammo_icon, (x, y))
         color = (200, 200, 50) if player.ammo > 3 else (220, 60, 60)
-        ammo_text = self.font.render(str(player.ammo), True, color)
+        ammo_text = self._text(self.font, str(player.ammo), color)
         screen.blit(ammo_text, (x + 16, y))
 
     def _render_medkits(self, screen: pygame.Surface, player):
@@ -120,60 +251,50 @@ class HUD:
             return
         x = SCREEN_W - 80
         y = 10
-        medkit_sprite = SpriteCache.get("item_medkit")
-        if medkit_sprite:
-            screen.blit(medkit_sprite, (x, y))
-        else:
-            pygame.draw.rect(screen, (200, 40, 40), (x, y, 12, 12))
-        text = self.font.render(f"x{player.medkits} [H]", True, (200, 255, 200))
+        screen.blit(SpriteCache.get("item_medkit") or self._fallback_medkit, (x, y))
+        text = self._text(self.font, f"x{player.medkits} [H]", (200, 255, 200))
         screen.blit(text, (x + 16, y))
 
-    def _render_quickbar(self, screen: pygame.Surface, player):
-        slot_bg = SpriteCache.get("ui_slot")
-        bar_w = INVENTORY_SIZE * 24 + (INVENTORY_SIZE - 1) * 2
-        start_x = (SCREEN_W - bar_w) // 2
-        y = SCREEN_H - 32
+    def _draw_quickbar_panel(self, player) -> pygame.Surface:
+        """Slot backgrounds, item icons and stack counts for the bottom bar."""
+        if self._quickbar_bg is None:
+            self._quickbar_bg = self._compose_slots(
+                24, [(i * 26, 0) for i in range(INVENTORY_SIZE)], _QUICKBAR_W, 24,
+                (40, 40, 50), (80, 80, 90))
+        # Extra room right and below for stack counts that spill past the last slot
+        screen = pygame.Surface((_QUICKBAR_W + 16, 32), pygame.SRCALPHA)
+        screen.blit(self._quickbar_bg, (0, 0))
 
         for i in range(INVENTORY_SIZE):
-            sx = start_x + i * 26
-            if slot_bg:
-                screen.blit(pygame.transform.scale(slot_bg, (24, 24)), (sx, y))
-            else:
-                pygame.draw.rect(screen, (40, 40, 50), (sx, y, 24, 24))
-                pygame.draw.rect(screen, (80, 80, 90), (sx, y, 24, 24), 1)
-
+            sx = i * 26
             slot = player.inventory[i]
             if slot:
-                item_sprite = SpriteCache.get(ITEM_DEFS[slot.item_id].sprite_name)
+                item_sprite = SpriteCache.get_scaled(ITEM_DEFS[slot.item_id].sprite_name, (18, 18))
                 if item_sprite:
-                    screen.blit(pygame.transform.scale(item_sprite, (18, 18)), (sx + 3, y + 3))
+                    screen.blit(item_sprite, (sx + 3, 3))
                 if slot.count > 1:
-                    count_text = self.font.render(str(slot.count), True, (255, 255, 255))
-                    screen.blit(count_text, (sx + 14, y + 14))
+                    count_text = self._text(self.font, str(slot.count), (255, 255, 255))
+                    screen.blit(count_text, (sx + 14, 14))
+        return screen
 
     def _render_extraction_bar(self, screen: pygame.Surface):
-        bar_w = 300
-        bar_h = 20
+        bar_w = _EXT_BAR_W
+        bar_h = _EXT_BAR_H
         x = (SCREEN_W - bar_w) // 2
-        y = 60
+        y = _EXT_BAR_Y
         progress = self.extraction_timer / max(self.extraction_total, 0.01)
         progress = min(1.0, max(0.0, progress))
 
-        pygame.draw.rect(screen, (40, 40, 50), (x - 2, y - 2, bar_w + 4, bar_h + 4))
-        pygame.draw.rect(screen, (60, 60, 70), (x, y, bar_w, bar_h))
+        screen.blit(self._ext_bar_bg, (x - 2, y - 2))
         fill_w = int(bar_w * progress)
         color = (50, 200, 50) if progress < 0.8 else (200, 200, 50)
         pygame.draw.rect(screen, color, (x, y, fill_w, bar_h))
-        label = self.font.render("EXTRACTING...", True, (255, 255, 255))
-        screen.blit(label, (x + bar_w // 2 - label.get_width() // 2, y - 20))
+        screen.blit(self._label_extracting, self._label_extracting_pos)
 
     def _render_inventory_screen(self, screen: pygame.Surface, player):
-        overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 160))
-        screen.blit(overlay, (0, 0))
+        screen.blit(self._inv_overlay, (0, 0))
 
-        title = self.font_large.render("INVENTORY", True, (255, 255, 255))
-        screen.blit(title, (SCREEN_W // 2 - title.get_width() // 2, 80))
+        screen.blit(self._label_inventory, self._label_inventory_pos)
 
         cols = 4
         slot_size = 48
@@ -182,31 +303,32 @@ class HUD:
         start_x = (SCREEN_W - grid_w) // 2
         start_y = 140
 
-        slot_bg = SpriteCache.get("ui_slot")
+        if self._inventory_bg is None:
+            rows = -(-INVENTORY_SIZE // cols)
+            self._inventory_bg = self._compose_slots(
+                slot_size,
+                [(i % cols * (slot_size + gap), i // cols * (slot_size + gap))
+                 for i in range(INVENTORY_SIZE)],
+                grid_w, rows * (slot_size + gap), (60, 60, 70), (100, 100, 110))
+        screen.blit(self._inventory_bg, (start_x, start_y))
+
         for i in range(INVENTORY_SIZE):
             col = i % cols
             row = i // cols
             sx = start_x + col * (slot_size + gap)
             sy = start_y + row * (slot_size + gap)
 
-            if slot_bg:
-                screen.blit(pygame.transform.scale(slot_bg, (slot_size, slot_size)), (sx, sy))
-            else:
-                pygame.draw.rect(screen, (60, 60, 70), (sx, sy, slot_size, slot_size))
-                pygame.draw.rect(screen, (100, 100, 110), (sx, sy, slot_size, slot_size), 1)
-
             slot = player.inventory[i]
             if slot:
                 defn = ITEM_DEFS.get(slot.item_id)
                 if defn:
-                    item_sprite = SpriteCache.get(defn.sprite_name)
+                    item_sprite = SpriteCache.get_scaled(defn.sprite_name, (36, 36))
                     if item_sprite:
-                        scaled = pygame.transform.scale(item_sprite, (36, 36))
-                        screen.blit(scaled, (sx + 6, sy + 2))
-                    name_text = self.font.render(defn.name, True, (220, 220, 220))
+                        screen.blit(item_sprite, (sx + 6, sy + 2))
+                    name_text = self._text(self.font, defn.name, (220, 220, 220))
                     screen.blit(name_text, (sx, sy + slot_size + 2))
                     if slot.count > 1:
-                        ct = self.font.render(f"x{slot.count}", True, (200, 200, 100))
+                        ct = self._text(self.font, f"x{slot.count}", (200, 200, 100))
                         screen.blit(ct, (sx + slot_size - ct.get_width(), sy + slot_size - 16))
 
         # Weapon info
@@ -214,8 +336,7 @@ class HUD:
         weapon_text = f"Weapon: {player.weapon_display_name}"
         if player.is_ranged:
             weapon_text += f"  Ammo: {player.ammo}"
-        wt = self.font_large.render(weapon_text, True, (255, 255, 200))
+        wt = self._text(self.font_large, weapon_text, (255, 255, 200))
         screen.blit(wt, (SCREEN_W // 2 - wt.get_width() // 2, wy))
 
-        hint = self.font.render("Press TAB to close    Q to swap weapon", True, (150, 150, 150))
-        screen.blit(hint, (SCREEN_W // 2 - hint.get_width() // 2, SCREEN_H - 50))
+        screen.blit(self._label_close_hint, self._label_close_hint_pos)
@@ -2,7 +2,9 @@
 
 import math
 import random
+from bisect import bisect_left
 from dataclasses import dataclass, field
+from itertools import accumulate
 
 import pygame
 
@@ -67,22 +69,27 @@ LOOT_TABLES = {
 }
 
 
+# Running weight totals per table, so a roll is one bisect instead of a scan
+_LOOT_PREFIX = {
+    name: list(accumulate(w for _, w, _, _ in table))
+    for name, table in LOOT_TABLES.items()
+}
+
+
 def roll_loot(table_name: str, rng: random.Random | None = None) -> list[tuple[str, int]]:
     """Roll 1-3 items from a loot table. Returns [(item_id, count), ...]."""
     r = rng or random
-    table = LOOT_TABLES.get(table_name, LOOT_TABLE_CRATE)
+    if table_name not in LOOT_TABLES:
+        table_name = "crate"
+    table = LOOT_TABLES[table_name]
+    prefix = _LOOT_PREFIX[table_name]
+    total_weight = prefix[-1]
     items_out = []
     num_rolls = r.randint(1, 3)
-    total_weight = sum(w for _, w, _, _ in table)
     for _ in range(num_rolls):
-        roll = r.random() * total_weight
-        cumulative = 0
-        for item_id, weight, mn, mx in table:
-            cumulative += weight
-            if roll <= cumulative:
-                count = r.randint(mn, mx)
-                items_out.append((item_id, count))
-                break
+        # First entry whose running total reaches the roll
+        item_id, _, mn, mx = table[bisect_left(prefix, r.random() * total_weight)]
+        items_out.append((item_id, r.randint(mn, mx)))
     return items_out
 
 
@@ -103,10 +110,7 @@ class Container:
         self.container_type = container_type  # "crate", "locker", "rubble_pile"
         self.opened = False
         self.sprite_name = f"obj_{container_type}"
-
-    @property
-    def rect(self) -> pygame.Rect:
-        return pygame.Rect(int(self.x), int(self.y), TILE_SIZE, TILE_SIZE)
+        self.rect = pygame.Rect(int(x), int(y), TILE_SIZE, TILE_SIZE)  # containers never move
 
     def open(self, rng: random.Random | None = None) -> list[tuple[str, int]]:
         if self.opened:
@@ -118,24 +122,25 @@ class Container:
 # ── Ground item (dropped or spawned on the map) ─────────────────────────────
 
 class GroundItem:
+    # Shared bob clock, advanced once per frame for every item
+    bob_clock = 0.0
+
     def __init__(self, x: float, y: float, item_id: str, count: int = 1):
         self.x = x
         self.y = y
         self.item_id = item_id
         self.count = count
-        self.bob_timer = random.random() * math.pi * 2  # offset for bob animation
+        self.bob_phase = random.random() * math.pi * 2  # offset for bob animation
         self.sprite_name = ITEM_DEFS[item_id].sprite_name if item_id in ITEM_DEFS else "item_scrap_wood"
+        self.rect = pygame.Rect(int(x), int(y), 12, 12)  # bobbing is draw-only
 
-    @property
-    def rect(self) -> pygame.Rect:
-        return pygame.Rect(int(self.x), int(self.y), 12, 12)
-
-    def update(self, dt: float):
-        self.bob_timer += dt * 3.0
+    @classmethod
+    def advance_bob(cls, dt: float):
+        cls.bob_clock = (cls.bob_clock + dt * 3.0) % math.tau
 
     @property
     def draw_y_offset(self) -> float:
-        return math.sin(self.bob_timer) * 2.0
+        return math.sin(self.bob_phase + GroundItem.bob_clock) * 2.0
 
 
 # ── Balloon Crate ────────────────────────────────────────────────────────────
@@ -150,10 +155,7 @@ class BalloonCrate:
         self.y = y
         self.state = self.STATE_INACTIVE
         self.timer = 0.0
-
-    @property
-    def rect(self) -> pygame.Rect:
-        return pygame.Rect(int(self.x), int(self.y), TILE_SIZE, TILE_SIZE)
+        self.rect = pygame.Rect(int(x), int(y), TILE_SIZE, TILE_SIZE)
 
     @property
     def sprite_name(self) -> str:
@@ -0,0 +1,62 @@
+"""Ash Diver — Shared tile collision resolvers (player + sirens)."""
+
+import numpy as np
+
+from settings import TILE_SIZE
+
+
+def overlapping_solid_tiles(solid: np.ndarray, grid_w: int, grid_h: int,
+                            left: int, top: int, w: int, h: int) -> list[tuple[int, int]]:
+    """Return (col, row) for every solid tile under a w*h box, in row-major order."""
+    col_start = max(0, left // TILE_SIZE)
+    col_end = min(grid_w, (left + w - 1) // TILE_SIZE + 1)
+    row_start = max(0, top // TILE_SIZE)
+    row_end = min(grid_h, (top + h - 1) // TILE_SIZE + 1)
+    if col_end <= col_start or row_end <= row_start:
+        return []
+    rows, cols = np.nonzero(solid[row_start:row_end, col_start:col_end])
+    return list(zip((cols + col_start).tolist(), (rows + row_start).tolist()))
+
+
+def resolve_x(solid: np.ndarray, grid_w: int, grid_h: int,
+              x: float, y: float, w: int, h: int, vx: float) -> float:
+    """Push a box out of solid tiles along X. Returns the corrected x."""
+    for col, _row in overlapping_solid_tiles(solid, grid_w, grid_h, int(x), int(y), w, h):
+        tile_left = col * TILE_SIZE
+        tile_right = tile_left + TILE_SIZE
+        if vx > 0:
+            x = tile_left - w
+        elif vx < 0:
+            x = tile_right
+        else:
+            # Pushed into a tile without horizontal velocity — nudge out
+            left = int(x)
+            if (left + w - tile_left) < (tile_right - left):
+                x = tile_left - w
+            else:
+                x = tile_right
+    return x
+
+
+def resolve_y(solid: np.ndarray, grid_w: int, grid_h: int,
+              x: float, y: float, w: int, h: int, vy: float) -> tuple[float, float, bool]:
+    """Push a box out of solid tiles along Y. Returns (y, vy, on_ground)."""
+    on_ground = False
+    for _col, row in overlapping_solid_tiles(solid, grid_w, grid_h, int(x), int(y), w, h):
+        tile_top = row * TILE_SIZE
+        tile_bottom = tile_top + TILE_SIZE
+        if vy > 0:
+            y = tile_top - h
+            vy = 0.0
+            on_ground = True
+        elif vy < 0:
+            y = tile_bottom
+            vy = 0.0
+        else:
+            top = int(y)
+            if (top + h - tile_top) < (tile_bottom - top):
+                y = tile_top - h
+                on_ground = True
+            else:
+                y = tile_bottom
+    return y, vy, on_ground
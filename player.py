@@ -3,20 +3,28 @@
 import math
 import random
 
+import numpy as np
 import pygame
 
 from settings import (
     PLAYER_W, PLAYER_H, GRAVITY, JUMP_VEL, MOVE_SPEED, MAX_FALL,
     PLAYER_MAX_HP, PLAYER_INVULN_TIME, INVENTORY_SIZE, TILE_SIZE,
-    SOLID_TILES, CLIMBABLE_TILES, LADDER_CLIMB_SPEED, WEAPON_STATS,
+    LADDER_CLIMB_SPEED, WEAPON_STATS,
     MELEE_RANGE, MELEE_COOLDOWN, RANGED_COOLDOWN, RANGED_SPEED, RANGED_LIFETIME,
 )
 from items import ITEM_DEFS, InvSlot, GroundItem
+from physics import resolve_x, resolve_y
+
+_WALK_SPRITES = ("player_walk1", "player_walk2")
+_HALF_PW = PLAYER_W / 2
+_HALF_PH = PLAYER_H / 2
 
 
 # ── Projectile ───────────────────────────────────────────────────────────────
 
 class Projectile:
+    __slots__ = ("x", "y", "vx", "vy", "damage", "alive", "timer", "_rect")
+
     def __init__(self, x: float, y: float, vx: float, vy: float, damage: int):
         self.x = x
         self.y = y
@@ -25,27 +33,43 @@ class Projectile:
         self.damage = damage
         self.alive = True
         self.timer = 0.0
+        self._rect = pygame.Rect(int(x), int(y), 4, 3)
 
     @property
     def rect(self) -> pygame.Rect:
-        return pygame.Rect(int(self.x), int(self.y), 4, 3)
-
-    def update(self, dt: float, grid: list[list[int]], grid_w: int, grid_h: int):
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.timer += dt
-        if self.timer > RANGED_LIFETIME:
-            self.alive = False
-            return
-        # Check wall collision
-        col = int(self.x + 2) // TILE_SIZE
-        row = int(self.y + 1) // TILE_SIZE
-        if 0 <= col < grid_w and 0 <= row < grid_h:
-            if grid[row][col] in SOLID_TILES:
-                self.alive = False
-        # Out of bounds
-        if col < 0 or col >= grid_w or row < 0 or row >= grid_h:
-            self.alive = False
+        r = self._rect
+        r.x = int(self.x)
+        r.y = int(self.y)
+        return r
+
+    @staticmethod
+    def step_all(projectiles: list["Projectile"], dt: float, solid: np.ndarray,
+                 grid_w: int, grid_h: int) -> int:
+        """Move every projectile and kill those that expire, hit a wall or leave the map.
+
+        One loop per frame with the constants in locals, rather than a method
+        call per bullet. Returns how many projectiles are dead afterwards.
+        """
+        ts = TILE_SIZE
+        lifetime = RANGED_LIFETIME
+        dead = 0
+        for p in projectiles:
+            if not p.alive:  # killed by a hit since the last step
+                dead += 1
+                continue
+            x = p.x = p.x + p.vx * dt
+            y = p.y = p.y + p.vy * dt
+            p.timer += dt
+            if p.timer > lifetime:
+                p.alive = False
+                dead += 1
+                continue
+            col = int(x + 2) // ts
+            row = int(y + 1) // ts
+            if not (0 <= col < grid_w and 0 <= row < grid_h) or solid[row, col]:
+                p.alive = False
+                dead += 1
+        return dead
 
 
 # ── Player ───────────────────────────────────────────────────────────────────
@@ -54,6 +78,15 @@ class Player:
     # All weapons the player can cycle through (None = fists)
     WEAPON_CYCLE = [None, "pipe", "pistol", "shotgun"]
 
+    __slots__ = (
+        "x", "y", "vx", "vy", "on_ground", "facing", "_rect",
+        "hp", "max_hp", "invuln_timer", "alive",
+        "inventory", "_item_counts", "_weapon", "_weapon_stats", "is_ranged",
+        "weapon_display_name", "owned_weapons", "ammo", "medkits",
+        "attack_timer", "attacking", "attack_anim_timer", "projectiles",
+        "on_ladder", "climb_input", "walk_timer",
+    )
+
     def __init__(self, x: float, y: float):
         self.x = x
         self.y = y
@@ -61,6 +94,7 @@ class Player:
         self.vy = 0.0
         self.on_ground = False
         self.facing = 1  # 1 = right, -1 = left
+        self._rect = pygame.Rect(int(x), int(y), PLAYER_W, PLAYER_H)
 
         # Health
         self.hp = PLAYER_MAX_HP
@@ -70,7 +104,8 @@ class Player:
 
         # Inventory
         self.inventory: list[InvSlot | None] = [None] * INVENTORY_SIZE
-        self.weapon: str | None = None  # "pipe", "pistol", or None (fists)
+        self._item_counts: dict[str, int] = {}  # running per-item totals of inventory
+        self.weapon = None  # "pipe", "pistol", or None (fists)
         self.owned_weapons: set[str] = set()  # weapons we've picked up
         self.ammo = 0
 
@@ -94,15 +129,15 @@ class Player:
 
     @property
     def rect(self) -> pygame.Rect:
-        return pygame.Rect(int(self.x), int(self.y), PLAYER_W, PLAYER_H)
+        return self._rect
 
     @property
     def center_x(self) -> float:
-        return self.x + PLAYER_W / 2
+        return self.x + _HALF_PW
 
     @property
     def center_y(self) -> float:
-        return self.y + PLAYER_H / 2
+        return self.y + _HALF_PH
 
     # ── Weapon swap ─────────────────────────────────────────────────────────
 
@@ -123,17 +158,16 @@ class Player:
         self.weapon = available[(idx + 1) % len(available)]
 
     @property
-    def weapon_display_name(self) -> str:
-        if self.weapon is None:
-            return "FISTS"
-        return self.weapon.upper()
+    def weapon(self) -> str | None:
+        return self._weapon
 
-    @property
-    def is_ranged(self) -> bool:
-        if self.weapon is None:
-            return False
-        stats = WEAPON_STATS.get(self.weapon)
-        return stats is not None and stats["type"] == "ranged"
+    @weapon.setter
+    def weapon(self, weapon: str | None):
+        # Derived weapon state is refreshed here so per-frame reads are plain loads
+        self._weapon = weapon
+        self._weapon_stats = WEAPON_STATS.get(weapon) if weapon is not None else None
+        self.is_ranged = self._weapon_stats is not None and self._weapon_stats["type"] == "ranged"
+        self.weapon_display_name = "FISTS" if weapon is None else weapon.upper()
 
     @property
     def is_melee(self) -> bool:
@@ -141,19 +175,20 @@ class Player:
 
     # ── Physics ──────────────────────────────────────────────────────────────
 
-    def _is_on_ladder(self, grid, grid_w, grid_h) -> bool:
+    def _is_on_ladder(self, climbable: np.ndarray, grid_w: int, grid_h: int) -> bool:
         col = int(self.center_x) // TILE_SIZE
         row = int(self.center_y) // TILE_SIZE
         if 0 <= col < grid_w and 0 <= row < grid_h:
-            if grid[row][col] in CLIMBABLE_TILES:
+            if climbable[row, col]:
                 return True
         row_feet = int(self.y + PLAYER_H - 2) // TILE_SIZE
         if 0 <= col < grid_w and 0 <= row_feet < grid_h:
-            if grid[row_feet][col] in CLIMBABLE_TILES:
+            if climbable[row_feet, col]:
                 return True
         return False
 
-    def update(self, dt: float, grid: list[list[int]], grid_w: int, grid_h: int):
+    def update(self, dt: float, climbable: np.ndarray, solid: np.ndarray,
+               grid_w: int, grid_h: int):
         # Timers
         if self.invuln_timer > 0:
             self.invuln_timer -= dt
@@ -171,7 +206,7 @@ class Player:
             self.walk_timer = 0
 
         # Ladder check
-        touching_ladder = self._is_on_ladder(grid, grid_w, grid_h)
+        touching_ladder = self._is_on_ladder(climbable, grid_w, grid_h)
         if touching_ladder and self.climb_input != 0:
             self.on_ladder = True
         elif not touching_ladder:
@@ -180,15 +215,15 @@ class Player:
         if self.on_ladder:
             self.vy = self.climb_input * LADDER_CLIMB_SPEED
             self.x += self.vx * 0.5 * dt
-            self._resolve_x(grid, grid_w, grid_h)
+            self._resolve_x(solid, grid_w, grid_h)
             self.y += self.vy * dt
-            self._resolve_y(grid, grid_w, grid_h)
+            self._resolve_y(solid, grid_w, grid_h)
         else:
             self.vy = min(self.vy + GRAVITY * dt, MAX_FALL)
             self.x += self.vx * dt
-            self._resolve_x(grid, grid_w, grid_h)
+            self._resolve_x(solid, grid_w, grid_h)
             self.y += self.vy * dt
-            self._resolve_y(grid, grid_w, grid_h)
+            self._resolve_y(solid, grid_w, grid_h)
 
         # Map boundary clamping
         map_w_px = grid_w * TILE_SIZE
@@ -206,11 +241,13 @@ class Player:
             self.y = map_h_px - PLAYER_H
             self.vy = 0
             self.on_ground = True
+        self._rect.x = int(self.x)
+        self._rect.y = int(self.y)
 
         # Update projectiles
-        for p in self.projectiles:
-            p.update(dt, grid, grid_w, grid_h)
-        self.projectiles = [p for p in self.projectiles if p.alive]
+        # Only rebuild the list on frames where something actually died
+        if Projectile.step_all(self.projectiles, dt, solid, grid_w, grid_h):
+            self.projectiles = [p for p in self.projectiles if p.alive]
 
     def handle_input(self, keys: pygame.key.ScancodeWrapper):
         move = 0
@@ -240,55 +277,13 @@ class Player:
 
     # ── Collision ────────────────────────────────────────────────────────────
 
-    def _get_overlapping_tiles(self, grid, grid_w, grid_h):
-        r = self.rect
-        col_start = max(0, r.left // TILE_SIZE)
-        col_end = min(grid_w, (r.right - 1) // TILE_SIZE + 1)
-        row_start = max(0, r.top // TILE_SIZE)
-        row_end = min(grid_h, (r.bottom - 1) // TILE_SIZE + 1)
-        for row in range(row_start, row_end):
-            for col in range(col_start, col_end):
-                if grid[row][col] in SOLID_TILES:
-                    tile_rect = pygame.Rect(
-                        col * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE
-                    )
-                    if r.colliderect(tile_rect):
-                        yield col, row, tile_rect
-
-    def _resolve_x(self, grid, grid_w, grid_h):
-        for _col, _row, tile_rect in self._get_overlapping_tiles(grid, grid_w, grid_h):
-            if self.vx > 0:
-                self.x = tile_rect.left - PLAYER_W
-            elif self.vx < 0:
-                self.x = tile_rect.right
-            else:
-                r = self.rect
-                overlap_left = r.right - tile_rect.left
-                overlap_right = tile_rect.right - r.left
-                if overlap_left < overlap_right:
-                    self.x = tile_rect.left - PLAYER_W
-                else:
-                    self.x = tile_rect.right
-
-    def _resolve_y(self, grid, grid_w, grid_h):
-        self.on_ground = False
-        for _col, _row, tile_rect in self._get_overlapping_tiles(grid, grid_w, grid_h):
-            if self.vy > 0:
-                self.y = tile_rect.top - PLAYER_H
-                self.vy = 0.0
-                self.on_ground = True
-            elif self.vy < 0:
-                self.y = tile_rect.bottom
-                self.vy = 0.0
-            else:
-                r = self.rect
-                overlap_top = r.bottom - tile_rect.top
-                overlap_bottom = tile_rect.bottom - r.top
-                if overlap_top < overlap_bottom:
-                    self.y = tile_rect.top - PLAYER_H
-                    self.on_ground = True
-                else:
-                    self.y = tile_rect.bottom
+    def _resolve_x(self, solid, grid_w, grid_h):
+        self.x = resolve_x(solid, grid_w, grid_h, self.x, self.y, PLAYER_W, PLAYER_H, self.vx)
+
+    def _resolve_y(self, solid, grid_w, grid_h):
+        self.y, self.vy, self.on_ground = resolve_y(
+            solid, grid_w, grid_h, self.x, self.y, PLAYER_W, PLAYER_H, self.vy
+        )
 
     # ── Health ───────────────────────────────────────────────────────────────
 
@@ -316,49 +311,54 @@ class Player:
         Returns a melee hitbox if melee, or None.
         Ranged attacks spawn projectiles internally.
         """
+        cx = self.x + _HALF_PW
+        cy = self.y + _HALF_PH
+
         # Face toward target
-        if target_wx > self.center_x:
+        if target_wx > cx:
             self.facing = 1
-        elif target_wx < self.center_x:
+        elif target_wx < cx:
             self.facing = -1
 
         if self.is_ranged:
-            self._ranged_attack(target_wx, target_wy)
+            self._ranged_attack(target_wx, target_wy, cx, cy)
             return None
         else:
-            return self._melee_attack(target_wx, target_wy)
+            return self._melee_attack(target_wx, target_wy, cx, cy)
 
-    def _melee_attack(self, target_wx: float, target_wy: float) -> pygame.Rect | None:
+    def _melee_attack(self, target_wx: float, target_wy: float,
+                      cx: float, cy: float) -> pygame.Rect | None:
         if self.attack_timer > 0:
             return None
-        stats = WEAPON_STATS.get(self.weapon or "pipe", WEAPON_STATS["pipe"])
+        stats = self._weapon_stats or WEAPON_STATS["pipe"]
         self.attack_timer = stats["cooldown"]
         self.attacking = True
         self.attack_anim_timer = 0.2
 
         # Direction toward target
-        dx = target_wx - self.center_x
-        dy = target_wy - self.center_y
+        dx = target_wx - cx
+        dy = target_wy - cy
         dist = max(1.0, (dx * dx + dy * dy) ** 0.5)
         nx = dx / dist
         ny = dy / dist
 
         rng = stats["range"]
-        cx = self.center_x + nx * (PLAYER_W / 2 + rng / 2)
-        cy = self.center_y + ny * (PLAYER_H / 4)
+        hx = cx + nx * (_HALF_PW + rng / 2)
+        hy = cy + ny * (PLAYER_H / 4)
         return pygame.Rect(
-            int(cx - rng / 2),
-            int(cy - rng / 2),
+            int(hx - rng / 2),
+            int(hy - rng / 2),
             rng,
             rng,
         )
 
-    def _ranged_attack(self, target_wx: float, target_wy: float) -> bool:
+    def _ranged_attack(self, target_wx: float, target_wy: float,
+                       cx: float, cy: float) -> bool:
         if self.attack_timer > 0:
             return False
-        stats = WEAPON_STATS.get(self.weapon)
-        if stats is None or stats["type"] != "ranged":
+        if not self.is_ranged:
             return False
+        stats = self._weapon_stats
         ammo_cost = stats.get("ammo_cost", 1)
         if self.ammo < ammo_cost:
             return False
@@ -373,8 +373,8 @@ class Player:
         damage = random.randint(max(1, base_dmg - 1), base_dmg)
 
         # Aim toward mouse target
-        px = self.center_x
-        py = self.center_y - 2
+        px = cx
+        py = cy - 2
         dx = target_wx - px
         dy = target_wy - py
         dist = max(1.0, (dx * dx + dy * dy) ** 0.5)
@@ -419,11 +419,14 @@ class Player:
                 self.medkits += count
             return True
 
+        counts = self._item_counts
+
         # Try to stack
         for slot in self.inventory:
             if slot and slot.item_id == item_id and slot.count < defn.stack_size:
                 add = min(count, defn.stack_size - slot.count)
                 slot.count += add
+                counts[item_id] = counts.get(item_id, 0) + add
                 count -= add
                 if count <= 0:
                     return True
@@ -434,22 +437,24 @@ class Player:
                 if slot is None:
                     add = min(count, defn.stack_size)
                     self.inventory[i] = InvSlot(item_id, add)
+                    counts[item_id] = counts.get(item_id, 0) + add
                     count -= add
                     break
             else:
                 return False  # inventory full
         return True
 
+    def clear_inventory(self):
+        self.inventory = [None] * len(self.inventory)
+        self._item_counts.clear()
+
     def count_item(self, item_id: str) -> int:
-        total = 0
-        for slot in self.inventory:
-            if slot and slot.item_id == item_id:
-                total += slot.count
-        return total
+        return self._item_counts.get(item_id, 0)
 
     def get_scrap_counts(self) -> dict[str, int]:
         from settings import SCRAP_TYPES
-        return {s: self.count_item(s) for s in SCRAP_TYPES}
+        counts = self._item_counts
+        return {s: counts.get(s, 0) for s in SCRAP_TYPES}
 
     # ── Sprite state ─────────────────────────────────────────────────────────
 
@@ -459,13 +464,13 @@ class Player:
         if self.attacking:
             return "player_attack"
         if self.on_ladder:
-            frame = int(self.walk_timer) % 2
-            return f"player_walk{frame + 1}" if self.climb_input != 0 else "player_idle"
+            if self.climb_input != 0:
+                return _WALK_SPRITES[int(self.walk_timer) % 2]
+            return "player_idle"
         if not self.on_ground:
             if self.vy < 0:
                 return "player_jump"
             return "player_fall"
         if abs(self.vx) > 1:
-            frame = int(self.walk_timer) % 2
-            return f"player_walk{frame + 1}"
+            return _WALK_SPRITES[int(self.walk_timer) % 2]
         return "player_idle"
@@ -3,13 +3,14 @@
 import math
 import random
 
+import numpy as np
 import pygame
 
 from settings import (
     SCREEN_W, SCREEN_H, TILE_SIZE, FPS,
     PLAYER_W, PLAYER_H, PLAYER_MAX_HP,
     T_AIR, T_SPAWN, T_CONTAINER, T_BALLOON_CRATE, T_ROAD, T_FLOOR,
-    SOLID_TILES, TILE_SPRITES, TILE_COLORS, ASSETS_DIR,
+    SOLID_TILES, CLIMBABLE_TILES, TILE_SPRITES, TILE_COLORS, ASSETS_DIR,
     SCENE_AIRSHIP, SCENE_FREEFALL, SCENE_SURFACE, SCENE_DEATH,
     EXTRACTION_TIME, HORDE_WAVE_INTERVAL, HORDE_WAVE_COUNT, HORDE_SIRENS_PER_WAVE,
     FREEFALL_DURATION, FREEFALL_START_SPEED, FREEFALL_END_SPEED,
@@ -128,6 +129,11 @@ class AirshipScene(Scene):
                 elif val == _Q:
                     self.npc_pos = (x * TILE_SIZE, y * TILE_SIZE)
 
+        # Collision grid is static once the spawn marker is cleared
+        self.collision_grid = self._make_collision_grid()
+        self.solid_mask = np.isin(self.collision_grid, list(SOLID_TILES))
+        self.climb_mask = np.isin(self.collision_grid, list(CLIMBABLE_TILES))
+
         self.font = pygame.font.SysFont(None, 28)
         self.font_small = pygame.font.SysFont(None, 22)
         self.font_large = pygame.font.SysFont(None, 48)
@@ -143,18 +149,14 @@ class AirshipScene(Scene):
 
     def _is_solid(self, col: int, row: int) -> bool:
         if 0 <= col < self.grid_w and 0 <= row < self.grid_h:
-            return self.grid[row][col] in AIRSHIP_SOLID
+            return bool(self.solid_mask[row, col])
         return True
 
-    def _make_collision_grid(self) -> list[list[int]]:
+    def _make_collision_grid(self) -> np.ndarray:
         """Create a grid compatible with player collision using SOLID_TILES."""
         from settings import T_FILL
-        cg = [[T_AIR] * self.grid_w for _ in range(self.grid_h)]
-        for y in range(self.grid_h):
-            for x in range(self.grid_w):
-                if self.grid[y][x] in AIRSHIP_SOLID:
-                    cg[y][x] = T_FILL
-        return cg
+        layout = np.array(self.grid, dtype=np.uint8)
+        return np.where(np.isin(layout, list(AIRSHIP_SOLID)), T_FILL, T_AIR).astype(np.uint8)
 
     def handle_events(self, events: list[pygame.event.Event]) -> str | None:
         for event in events:
@@ -226,8 +228,7 @@ class AirshipScene(Scene):
 
         keys = pygame.key.get_pressed()
         self.player.handle_input(keys)
-        cg = self._make_collision_grid()
-        self.player.update(dt, cg, self.grid_w, self.grid_h)
+        self.player.update(dt, self.climb_mask, self.solid_mask, self.grid_w, self.grid_h)
         self.camera.update(self.player.center_x, self.player.center_y)
         return None
 
@@ -236,9 +237,9 @@ class AirshipScene(Scene):
 
         cam_x, cam_y = int(self.camera.x), int(self.camera.y)
 
-        for y in range(self.grid_h):
-            for x in range(self.grid_w):
-                tile = self.grid[y][x]
+        tile_blits = []
+        for y, grid_row in enumerate(self.grid):
+            for x, tile in enumerate(grid_row):
                 if tile == _A or tile == _S:
                     continue
                 sx = x * TILE_SIZE - cam_x
@@ -249,11 +250,12 @@ class AirshipScene(Scene):
                 if sprite_name:
                     sprite = load_sprite(sprite_name)
                     if sprite:
-                        screen.blit(sprite, (sx, sy))
+                        tile_blits.append((sprite, (sx, sy)))
                         continue
                 # Fallback color
                 color = {_W: (85, 90, 100), _F: (100, 105, 115), _N: (160, 210, 240)}.get(tile, (100, 100, 100))
                 pygame.draw.rect(screen, color, (sx, sy, TILE_SIZE, TILE_SIZE))
+        screen.blits(tile_blits, doreturn=False)
 
         # Draw hatch
         if self.hatch_pos:
@@ -354,9 +356,9 @@ class AirshipScene(Scene):
             ix = SCREEN_W // 2 - 230
             item_def = ITEM_DEFS.get(item["id"])
             if item_def:
-                sprite = SpriteCache.get(item_def.sprite_name)
+                sprite = SpriteCache.get_scaled(item_def.sprite_name, (32, 32))
                 if sprite:
-                    screen.blit(pygame.transform.scale(sprite, (32, 32)), (ix, y + 4))
+                    screen.blit(sprite, (ix, y + 4))
 
             # Name and description
             name_color = (255, 255, 255) if can_buy else (120, 120, 120)
@@ -583,8 +585,9 @@ class SurfaceScene(Scene):
         cfg = SuburbsConfig(seed=game_state.get("run_seed", 42))
         gen = SuburbsGenerator(cfg)
         self.grid = gen.generate()
-        self.grid_h = len(self.grid)
-        self.grid_w = len(self.grid[0])
+        self.grid_h, self.grid_w = self.grid.shape
+        self.solid_mask = np.isin(self.grid, list(SOLID_TILES))
+        self.climb_mask = np.isin(self.grid, list(CLIMBABLE_TILES))
 
         # Find spawn
         spawn_x = gen.spawn_pos[0] * TILE_SIZE + (TILE_SIZE - PLAYER_W) // 2
@@ -657,7 +660,7 @@ class SurfaceScene(Scene):
 
         # Pre-render tile surfaces
         self.tile_cache: dict[int, pygame.Surface | None] = {}
-        for tid in set(t for row in self.grid for t in row):
+        for tid in np.unique(self.grid).tolist():
             self.tile_cache[tid] = get_tile_surface(tid)
 
         self.font = pygame.font.SysFont(None, 28)
@@ -744,7 +747,7 @@ class SurfaceScene(Scene):
             kept = count // 2
             self.game_state[stype] = self.game_state.get(stype, 0) + kept
         # Clear player inventory
-        self.player.inventory = [None] * len(self.player.inventory)
+        self.player.clear_inventory()
         # Crate launches away
         if self.extraction_choice_crate:
             self.extraction_choice_crate.state = BalloonCrate.STATE_READY
@@ -765,12 +768,11 @@ class SurfaceScene(Scene):
 
         keys = pygame.key.get_pressed()
         self.player.handle_input(keys)
-        self.player.update(dt, self.grid, self.grid_w, self.grid_h)
+        self.player.update(dt, self.climb_mask, self.solid_mask, self.grid_w, self.grid_h)
         self.camera.update(self.player.center_x, self.player.center_y)
 
-        # Update ground items
-        for gi in self.ground_items:
-            gi.update(dt)
+        # Update ground items (one shared bob clock instead of a timer per item)
+        GroundItem.advance_bob(dt)
 
         # Pickup ground items
         pr = self.player.rect
@@ -782,10 +784,14 @@ class SurfaceScene(Scene):
         for i in reversed(picked):
             self.ground_items.pop(i)
 
-        # Update enemies
-        for siren in self.sirens:
-            siren.update(dt, self.grid, self.grid_w, self.grid_h,
-                         self.player.center_x, self.player.center_y)
+        # Update enemies (sleeping sirens are culled in one vectorized pass)
+        px, py = self.player.center_x, self.player.center_y
+        awake = Siren.awake_mask(self.sirens, px, py).tolist()
+        for siren, is_awake in zip(self.sirens, awake):
+            if not is_awake:
+                siren.asleep = True
+                continue
+            siren.update(dt, self.solid_mask, self.grid_w, self.grid_h, px, py)
             # Siren attacks
             if siren.alive:
                 dmg = siren.try_attack(pr)
@@ -860,13 +866,14 @@ class SurfaceScene(Scene):
         # Sky background
         screen.fill(TILE_COLORS.get(T_AIR, (135, 206, 235)))
 
-        cam_x, cam_y = int(self.camera.x), int(self.camera.y)
+        cam_fx, cam_fy = self.camera.x, self.camera.y
+        cam_x, cam_y = int(cam_fx), int(cam_fy)
 
         # Visible tile range
         c0, c1, r0, r1 = self.camera.visible_tile_range()
-        for row in range(r0, min(r1, self.grid_h)):
-            for col in range(c0, min(c1, self.grid_w)):
-                tile = self.grid[row][col]
+        tile_blits = []
+        for row, grid_row in enumerate(self.grid[r0:r1, c0:c1].tolist(), r0):
+            for col, tile in enumerate(grid_row, c0):
                 if tile == T_AIR or tile == T_SPAWN:
                     continue
                 sx = col * TILE_SIZE - cam_x
@@ -878,14 +885,16 @@ class SurfaceScene(Scene):
 
                 surf = self.tile_cache.get(tile)
                 if surf:
-                    screen.blit(surf, (sx, sy))
+                    tile_blits.append((surf, (sx, sy)))
                 else:
                     color = TILE_COLORS.get(tile, (255, 0, 255))
                     pygame.draw.rect(screen, color, (sx, sy, TILE_SIZE, TILE_SIZE))
+        # Tiles never overlap, so batching after the fallback rects is order-safe
+        screen.blits(tile_blits, doreturn=False)
 
         # Draw containers
         for container in self.containers:
-            cx, cy = self.camera.apply(container.x, container.y)
+            cx, cy = int(container.x - cam_fx), int(container.y - cam_fy)
             if -TILE_SIZE < cx < SCREEN_W + TILE_SIZE and -TILE_SIZE < cy < SCREEN_H + TILE_SIZE:
                 sprite = load_sprite(container.sprite_name)
                 if container.opened:
@@ -936,7 +945,7 @@ class SurfaceScene(Scene):
 
         # Draw ground items
         for gi in self.ground_items:
-            gx, gy = self.camera.apply(gi.x, gi.y + gi.draw_y_offset)
+            gx, gy = int(gi.x - cam_fx), int(gi.y + gi.draw_y_offset - cam_fy)
             if -12 < gx < SCREEN_W + 12 and -12 < gy < SCREEN_H + 12:
                 sprite = load_sprite(gi.sprite_name)
                 if sprite:
@@ -946,7 +955,7 @@ class SurfaceScene(Scene):
 
         # Draw sirens
         for siren in self.sirens:
-            ex, ey = self.camera.apply(siren.x, siren.y)
+            ex, ey = int(siren.x - cam_fx), int(siren.y - cam_fy)
             if -SIREN_W < ex < SCREEN_W + SIREN_W and -SIREN_H < ey < SCREEN_H + SIREN_H:
                 sprite = load_sprite(siren.get_sprite_name())
                 if sprite:
@@ -966,7 +975,7 @@ class SurfaceScene(Scene):
 
         # Draw projectiles
         for proj in self.player.projectiles:
-            px, py = self.camera.apply(proj.x, proj.y)
+            px, py = int(proj.x - cam_fx), int(proj.y - cam_fy)
             pygame.draw.rect(screen, (255, 255, 100), (px, py, 4, 3))
 
         # Draw player
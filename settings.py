@@ -114,6 +114,7 @@ SIREN_ATTACK_COOLDOWN = 1.2
 SIREN_JUMP_VEL = -280.0
 SIREN_W = 16
 SIREN_H = 24
+SIREN_SLEEP_DISTANCE = 2000  # px (Manhattan); idle sirens beyond this skip AI + physics
 
 # ── Extraction ───────────────────────────────────────────────────────────────
 